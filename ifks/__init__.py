@@ -0,0 +1,6 @@
+"""
+Analyse van de IFKS 2025 GPS-tracking data.
+
+Het pakket importeert zelf niets zwaars: pandas, matplotlib, folium en geopy
+worden pas geladen door de subcommando's die ze nodig hebben.
+"""
@@ -0,0 +1,3 @@
+from ifks.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,146 @@
+"""
+Rapporten voor een heel kampioenschap in één keer.
+
+Per (evenement, klasse, schip) wordt een rapport-job gemaakt. De jobs
+draaien op een begrensde pool van processen; de voortgang wordt na iedere
+job in een statusbestand bijgehouden, zodat een afgebroken of deels
+mislukte run hervat kan worden zonder klaar werk opnieuw te doen. Een job
+wordt opnieuw gedraaid als zijn wedstrijdbestanden veranderd zijn of als
+het rapport ontbreekt.
+"""
+
+import contextlib
+import hashlib
+import io
+import json
+import os
+import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from ifks.data import DATA_DIR, DISCOVER_PATTERN, discover_races
+
+OUTPUT_ROOT = Path("batch_output")
+STATE_FILE = "batch_status.json"
+
+
+def slug(name):
+    return re.sub(r'[^\w-]+', '_', name).strip('_')
+
+
+def build_jobs(groups, output_root=OUTPUT_ROOT, klassen=None, boats=None):
+    """
+    Maak de werkrij: één job per schip per (evenement, klasse).
+
+    Een schip krijgt alleen de wedstrijden waarin het heeft gevaren.
+    """
+    jobs = []
+    for (event, klasse), races in sorted(groups.items()):
+        if klassen and klasse not in klassen:
+            continue
+        ships = sorted({ship for race in races for ship in race['ships']})
+        for ship in ships:
+            if boats and ship not in boats:
+                continue
+            job_dir = Path(output_root) / slug(event) / slug(f"Klasse {klasse}") / slug(ship)
+            race_files = [str(race['path']) for race in races if ship in race['ships']]
+            jobs.append({
+                'key': f"{event}|{klasse}|{ship}",
+                'event': event,
+                'klasse': klasse,
+                'team': ship,
+                'race_files': race_files,
+                'inputs': fingerprint(race_files),
+                'output_dir': str(job_dir / "rapport_output"),
+                'report_path': str(job_dir / "rapport.md"),
+            })
+    return jobs
+
+
+def fingerprint(race_files):
+    """Verandert als er een wedstrijdbestand bijkomt, wegvalt of wijzigt."""
+    parts = []
+    for race_file in sorted(race_files):
+        stat = Path(race_file).stat()
+        parts.append(f"{race_file}|{stat.st_mtime_ns}|{stat.st_size}")
+    return hashlib.sha1("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def is_done(job, state):
+    entry = state.get(job['key'], {})
+    return (entry.get('status') == 'ok' and entry.get('inputs') == job['inputs']
+            and Path(job['report_path']).exists())
+
+
+def load_state(path):
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def save_state(path, state):
+    # Eerst naar een tijdelijk bestand, zodat een onderbreking het statusbestand niet corrumpeert
+    tmp = Path(f"{path}.tmp")
+    with open(tmp, 'w') as f:
+        json.dump(state, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def run_job(job):
+    """Draait in een werkproces; geeft (key, fout of None, duur) terug."""
+    from ifks.report import generate_report
+
+    t0 = time.perf_counter()
+    try:
+        # De voortgangsmeldingen van generate_report lopen anders door elkaar
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_report(job['team'], job['race_files'], job['output_dir'], job['report_path'])
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return job['key'], error, time.perf_counter() - t0
+
+
+def run_batch(data_dir=DATA_DIR, pattern=DISCOVER_PATTERN, output_root=OUTPUT_ROOT,
+              workers=None, klassen=None, boats=None, restart=False):
+    """
+    Ontdek de wedstrijden, plan de jobs en voer de openstaande uit.
+
+    Jobs die in een eerdere run met dezelfde wedstrijdbestanden gelukt zijn
+    en waarvan het rapport er nog staat, worden overgeslagen, tenzij
+    `restart` is gezet. Geeft het aantal mislukte jobs terug.
+    """
+    output_root = Path(output_root)
+    output_root.mkdir(parents=True, exist_ok=True)
+    state_path = output_root / STATE_FILE
+    state = {} if restart else load_state(state_path)
+
+    jobs = build_jobs(discover_races(data_dir, pattern), output_root, klassen, boats)
+    todo = [job for job in jobs if not is_done(job, state)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(todo) or 1))
+
+    print(f"📋 {len(jobs)} jobs, {len(jobs) - len(todo)} al klaar, {len(todo)} te doen ({workers} workers)")
+
+    failed = 0
+    inputs = {job['key']: job['inputs'] for job in todo}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_job, job) for job in todo]
+        for done, future in enumerate(as_completed(futures), 1):
+            key, error, elapsed = future.result()
+            if error:
+                failed += 1
+                state[key] = {'status': 'failed', 'error': error.strip().splitlines()[-1]}
+                print(f"[{done}/{len(todo)}] ❌ {key} ({elapsed:.1f}s): {state[key]['error']}")
+            else:
+                state[key] = {'status': 'ok', 'seconds': round(elapsed, 1), 'inputs': inputs[key]}
+                print(f"[{done}/{len(todo)}] ✅ {key} ({elapsed:.1f}s)")
+            save_state(state_path, state)
+
+    print(f"\n{len(todo) - failed} gelukt, {failed} mislukt. Status: {state_path}")
+    if failed:
+        print("Draai hetzelfde commando opnieuw om alleen de mislukte jobs te herhalen.")
+    return failed
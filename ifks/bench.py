@@ -0,0 +1,69 @@
+"""
+Tijdmetingen van de belangrijkste stappen van de analyse.
+"""
+
+import subprocess
+import sys
+import time
+
+from ifks.data import TEAM_NAAM, load_race_data, speed_ranking
+
+
+def timed(label, func, repeat=1):
+    """Voer `func` `repeat` keer uit en geef (label, beste tijd, resultaat) terug."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return label, best, result
+
+
+def cli_startup(args):
+    """Wandkloktijd van een los `python -m ifks` proces."""
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'ifks', *args],
+                   check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - t0
+
+
+def import_time(module):
+    """Wandkloktijd van een los proces dat alleen `module` importeert."""
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, '-c', f'import {module}'], check=True)
+    return time.perf_counter() - t0
+
+
+def run_bench(race_files, team=TEAM_NAAM, repeat=3):
+    race_files = [str(f) for f in race_files]
+    results = []
+
+    results.append(timed("cli: races (nieuw proces)", lambda: cli_startup(['races', *race_files]), repeat)[:2])
+    results.append(timed("json laden", lambda: [load_race_data(f) for f in race_files], repeat)[:2])
+    results.append(timed("ranking (stdlib)", lambda: speed_ranking(race_files), repeat)[:2])
+
+    from ifks.compare import compare_race
+    race = load_race_data(race_files[0])
+    results.append(timed("vergelijking alle paren (1 wedstrijd)", lambda: compare_race(race), repeat)[:2])
+
+    from ifks.wind import analyse_race
+    results.append(timed("windshifts (1 wedstrijd)", lambda: analyse_race(race), repeat)[:2])
+
+    results.append(timed("import ifks.report (nieuw proces)", lambda: import_time('ifks.report'), repeat)[:2])
+
+    from ifks import report
+
+    label, elapsed, loaded = timed("dataframes opbouwen", lambda: report.load_races(race_files), repeat)
+    results.append((label, elapsed))
+    all_races, all_wind, _ = loaded
+    results.append(timed("windhoek (TWA)", lambda: report.compute_twa(all_races, all_wind, team), repeat)[:2])
+
+    return results
+
+
+def print_bench(results):
+    width = max(len(label) for label, _ in results)
+    for label, elapsed in results:
+        print(f"{label:<{width}}  {elapsed * 1000:9.1f} ms")
@@ -0,0 +1,228 @@
+"""
+Command-line interface: ``python -m ifks <subcommando>``.
+
+Zware bibliotheken worden pas binnen het gekozen subcommando geïmporteerd,
+zodat ``races`` en ``ranking`` direct starten.
+"""
+
+import argparse
+from pathlib import Path
+
+from ifks.data import (DATA_DIR, DISCOVER_PATTERN, RACE_PATTERN, TEAM_NAAM, boat_names, find_race_files, race_summary,
+                       speed_ranking)
+
+
+def _race_files(args):
+    if args.files:
+        return [Path(f) for f in args.files]
+    return find_race_files(args.data_dir, args.pattern)
+
+
+def _required_race_files(args):
+    race_files = _race_files(args)
+    if not race_files:
+        raise SystemExit(f"Geen wedstrijdbestanden gevonden in {args.data_dir}")
+    return race_files
+
+
+def _require_team(args, race_files):
+    if args.team not in boat_names(race_files):
+        raise SystemExit(f"{args.team} heeft niet gevaren in deze wedstrijden")
+
+
+def _single_race(args):
+    return _required_race_files(args)[0]
+
+
+def cmd_races(args):
+    for filepath in _race_files(args):
+        info = race_summary(filepath)
+        print(f"{info['race']:<28} {info['start'].strftime('%d-%m-%Y %H:%M')} "
+              f"{info['duration_min']:4.0f} min  {info['ships']:2d} schepen  "
+              f"{info['windstations']:2d} windstations")
+
+
+def cmd_ranking(args):
+    overall, per_race = speed_ranking(_race_files(args))
+    if args.per_race:
+        for race, speeds in per_race.items():
+            print(f"\n{race}")
+            for rank, (ship, speed) in enumerate(speeds, 1):
+                marker = " <" if ship == args.team else ""
+                print(f"  #{rank:<3} {ship:<24} {speed:6.1f}{marker}")
+        return
+    for rank, (ship, speed, count) in enumerate(overall, 1):
+        marker = " <" if ship == args.team else ""
+        print(f"#{rank:<3} {ship:<24} {speed:6.1f}  ({count:,} punten){marker}")
+
+
+def cmd_report(args):
+    from ifks.report import generate_report
+    race_files = _required_race_files(args)
+    _require_team(args, race_files)
+    generate_report(args.team, race_files, args.output_dir, args.report)
+
+
+def cmd_html(args):
+    from ifks.html_report import generate_html_report
+    race_files = _required_race_files(args)
+    _require_team(args, race_files)
+    generate_html_report(args.team, race_files, args.output)
+    print(f"HTML rapport opgeslagen: {args.output}")
+
+
+def cmd_map(args):
+    from ifks import maps
+    shiptracks = maps.track_map(_single_race(args), args.output, args.start, args.end, args.buoys)
+    print(f"Kaart opgeslagen: {args.output}")
+    if args.speed_chart:
+        maps.average_speed_chart(maps.average_speeds(shiptracks), args.speed_chart)
+        print(f"Snelheidsgrafiek opgeslagen: {args.speed_chart}")
+
+
+def _plot_over_time(args, field):
+    from ifks.timeseries import CACHE_DIR, plot_over_time
+    from_cache = plot_over_time(_single_race(args), field, args.output, args.team, args.start_clock,
+                                cache_dir=None if args.no_cache else CACHE_DIR)
+    print(f"Grafiek opgeslagen: {args.output}{' (uit cache)' if from_cache else ''}")
+
+
+def cmd_speed_plot(args):
+    _plot_over_time(args, 'speed')
+
+
+def cmd_course_plot(args):
+    _plot_over_time(args, 'course')
+
+
+def cmd_compare(args):
+    import numpy as np
+    from ifks.compare import compare_file, final_gain_matrix, head_to_head
+
+    race_file = _single_race(args)
+    try:
+        result = compare_file(race_file, args.step)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    if args.matrix:
+        names = result['names']
+        matrix = final_gain_matrix(result)
+        print(f"Winst (m) van rij op kolom, van start tot finish - {race_file}")
+        print(" " * 18 + "".join(f"{name[:7]:>8}" for name in names))
+        for name, row in zip(names, matrix):
+            print(f"{name[:17]:<18}" + "".join("       -" if np.isnan(v) else f"{v:8.0f}" for v in row))
+        return
+    try:
+        rows = head_to_head(result, args.team)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print(f"{args.team} tegen de vloot - {race_file}")
+    print(f"{'Tegenstander':<24} {'winst (m)':>10} {'Δ snelheid':>11} {'Δ VMG':>8} {'|Δ koers|':>10}")
+    for row in rows:
+        print(f"{row['opponent']:<24} {row['gain']:10.0f} {row['speed']:11.1f} "
+              f"{row['vmg']:8.1f} {row['course']:9.0f}°")
+
+
+def cmd_wind(args):
+    from datetime import datetime
+    from ifks.data import load_race_data
+    from ifks.wind import analyse_race
+
+    for filepath in _race_files(args):
+        result = analyse_race(load_race_data(filepath))
+        print(f"\n{filepath}: gemiddelde wind {result['reference']:.0f}°, "
+              f"{result['gusts']} vlagen, {result['lulls']} luwtes")
+        for shift in result['shifts']:
+            print(f"  {datetime.fromtimestamp(shift['time']).strftime('%H:%M')} "
+                  f"{shift['kind']:<9} {shift['delta']:+.0f}°")
+        usage = result['usage'].get(args.team)
+        if usage and usage['upwind']:
+            print(f"  {args.team}: {usage['lifted'] / usage['upwind'] * 100:.1f}% opgelopen, "
+                  f"{usage['headed'] / usage['upwind'] * 100:.1f}% gekrompen aan de wind")
+
+
+def cmd_batch(args):
+    from ifks.batch import run_batch
+    failed = run_batch(args.data_dir, args.pattern, args.output_root, args.workers,
+                       args.klasse, args.boat, args.restart)
+    if failed:
+        raise SystemExit(1)
+
+
+def cmd_bench(args):
+    from ifks.bench import print_bench, run_bench
+    print_bench(run_bench(_required_race_files(args), args.team, args.repeat))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='ifks', description="Analyse van de IFKS 2025 tracking data.")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('files', nargs='*', help="wedstrijdbestanden (standaard: alles in --data-dir)")
+    common.add_argument('--data-dir', type=Path, default=DATA_DIR)
+    common.add_argument('--pattern', default=RACE_PATTERN, help=f"glob voor wedstrijdbestanden (standaard: {RACE_PATTERN})")
+    common.add_argument('--team', default=TEAM_NAAM)
+
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('races', parents=[common], help="toon de gevonden wedstrijden")
+    p.set_defaults(func=cmd_races)
+
+    p = sub.add_parser('ranking', parents=[common], help="print de snelheidsranking")
+    p.add_argument('--per-race', action='store_true', help="ranking per wedstrijd")
+    p.set_defaults(func=cmd_ranking)
+
+    p = sub.add_parser('report', parents=[common], help="genereer het Markdown rapport")
+    p.add_argument('--output-dir', type=Path, default=Path("rapport_output"))
+    p.add_argument('--report', type=Path, default=Path("rapport_drie_gebroeders.md"))
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser('html', parents=[common], help="interactief HTML rapport voor alle schepen en wedstrijden")
+    p.add_argument('--output', type=Path, default=Path("rapport.html"))
+    p.set_defaults(func=cmd_html)
+
+    p = sub.add_parser('map', parents=[common], help="kaart van de tracks van één wedstrijd")
+    p.add_argument('--output', type=Path, default=Path("sailing_tracks_map.html"))
+    p.add_argument('--start', type=int, help="Unix tijd; standaard de eerste meting")
+    p.add_argument('--end', type=int, help="Unix tijd; standaard de laatste meting")
+    p.add_argument('--buoys', action='store_true', help="teken ook de boeien")
+    p.add_argument('--speed-chart', type=Path, help="sla ook een staafgrafiek van de gemiddelde snelheid op")
+    p.set_defaults(func=cmd_map)
+
+    for name, func, default, what in (('speed-plot', cmd_speed_plot, "speed_tijd.png", "snelheid"),
+                                      ('course-plot', cmd_course_plot, "koers_tijd.png", "koers")):
+        p = sub.add_parser(name, parents=[common], help=f"{what} over tijd voor één wedstrijd")
+        p.add_argument('--output', type=Path, default=Path(default))
+        p.add_argument('--start-clock', help="begintijd (HH:MM, standaard de start van de wedstrijd)")
+        p.add_argument('--no-cache', action='store_true', help="teken opnieuw, ook als de grafiek al gecachet is")
+        p.set_defaults(func=func)
+
+    p = sub.add_parser('compare', parents=[common], help="head-to-head vergelijking voor één wedstrijd")
+    p.add_argument('--step', type=int, default=5, help="tijdstap van het grid in seconden")
+    p.add_argument('--matrix', action='store_true', help="toon de winst van ieder schip op ieder ander schip")
+    p.set_defaults(func=cmd_compare)
+
+    p = sub.add_parser('wind', parents=[common], help="windshifts, vlagen en gebruik van de shifts")
+    p.set_defaults(func=cmd_wind)
+
+    p = sub.add_parser('batch', help="rapporten voor alle evenementen, klassen en schepen")
+    p.add_argument('--data-dir', type=Path, default=DATA_DIR)
+    p.add_argument('--pattern', default=DISCOVER_PATTERN, help=f"glob voor wedstrijdbestanden (standaard: {DISCOVER_PATTERN})")
+    p.add_argument('--output-root', type=Path, default=Path("batch_output"))
+    p.add_argument('--workers', type=int, help="aantal processen (standaard: aantal cores)")
+    p.add_argument('--klasse', action='append', help="alleen deze klasse (herhaalbaar)")
+    p.add_argument('--boat', action='append', help="alleen dit schip (herhaalbaar)")
+    p.add_argument('--restart', action='store_true', help="negeer de status van een vorige run")
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser('bench', parents=[common], help="tijdmetingen van de analysestappen")
+    p.add_argument('--repeat', type=int, default=3)
+    p.set_defaults(func=cmd_bench)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+    return 0
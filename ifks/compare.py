@@ -0,0 +1,282 @@
+"""
+Head-to-head vergelijking van schepen op een gemeenschappelijk tijdgrid.
+
+Alle tracks van een wedstrijd worden naar hetzelfde grid geïnterpoleerd,
+waarna de verschillen voor alle paren in één keer met broadcasting worden
+berekend. Iedere grootheid komt terug als array van (paren x tijd).
+
+De winst telt alleen tussen de echte start (de vloot passeert de startlijn)
+en de finish van ieder schip, en alleen terwijl beide schepen hetzelfde
+soort rak varen: aan de wind telt vooruitgang tegen de wind in, voor de
+wind vooruitgang met de wind mee.
+"""
+
+import numpy as np
+
+from ifks.data import SPEED_THRESHOLD, load_race_data
+from ifks.wind import fleet_wind, interp_angle, wrap180
+
+EARTH_RADIUS = 6371000.0  # meter
+MAX_GAP = 30  # seconden zonder meting waarna een schip als 'geen data' telt
+START_WINDOW = 180  # seconden waarin minstens de helft van de vloot de startlijn passeert
+LEG_WINDOW = 120  # seconden waarover de VMG wordt gemiddeld om het rak te bepalen
+
+
+def time_grid(data, step=5):
+    """Tijdstippen van start tot finish van de wedstrijd, om de `step` seconden."""
+    return np.arange(data['starttime'], data['endtime'] + 1, step, dtype=np.int64)
+
+
+def align_tracks(data, grid, max_gap=MAX_GAP):
+    """
+    Interpoleer alle shiptracks naar `grid`.
+
+    Geeft een dict met 'names' en arrays van (schepen x tijd): 'x' en 'y'
+    (meter oost/noord t.o.v. het midden van de vloot), 'speed', 'course' en
+    'valid' (False buiten de track of bij een gat groter dan `max_gap`).
+    """
+    ships = data['shiptracks']
+    n, t = len(ships), len(grid)
+    lat = np.empty((n, t))
+    lon = np.empty((n, t))
+    speed = np.empty((n, t))
+    course = np.empty((n, t))
+    valid = np.zeros((n, t), dtype=bool)
+
+    for i, ship in enumerate(ships):
+        stamps, first = np.unique(np.asarray(ship['stamp'], dtype=np.int64), return_index=True)
+        lat[i] = np.interp(grid, stamps, np.asarray(ship['lat'])[first])
+        lon[i] = np.interp(grid, stamps, np.asarray(ship['lon'])[first])
+        speed[i] = np.interp(grid, stamps, np.asarray(ship['speed'], dtype=float)[first])
+        course[i] = interp_angle(grid, stamps, np.asarray(ship['course'], dtype=float)[first])
+
+        if len(stamps) < 2:
+            continue
+        # Gat rond ieder gridpunt: afstand tussen de omliggende metingen
+        right = np.clip(np.searchsorted(stamps, grid), 1, len(stamps) - 1)
+        gap = stamps[right] - stamps[right - 1]
+        valid[i] = (grid >= stamps[0]) & (grid <= stamps[-1]) & (gap <= max_gap)
+
+    # Equirectangulaire projectie; ruim nauwkeurig genoeg voor een wedstrijdbaan
+    lat0 = lat[valid].mean() if valid.any() else 0.0
+    lon0 = lon[valid].mean() if valid.any() else 0.0
+    x, y = project(lat, lon, lat0, lon0)
+
+    return {
+        'names': [ship['name'] for ship in ships],
+        'origin': (lat0, lon0),
+        'x': x,
+        'y': y,
+        'speed': speed,
+        'course': course,
+        'valid': valid,
+    }
+
+
+def project(lat, lon, lat0, lon0):
+    """Meter oost/noord t.o.v. (lat0, lon0)."""
+    x = np.radians(np.asarray(lon) - lon0) * np.cos(np.radians(lat0)) * EARTH_RADIUS
+    y = np.radians(np.asarray(lat) - lat0) * EARTH_RADIUS
+    return x, y
+
+
+def buoy_line(data, name, grid, origin):
+    """
+    Eindpunten van de lijn van boei `name` naar zijn 'lineto'-boei op `grid`,
+    als ((x1, y1), (x2, y2)); None als de boeien ontbreken.
+    """
+    buoys = {b['name']: b for b in data.get('buoytracks', []) if b['stamp']}
+    if name not in buoys or buoys[name].get('lineto') not in buoys:
+        return None
+    ends = []
+    for buoy in (buoys[name], buoys[buoys[name]['lineto']]):
+        stamps, first = np.unique(np.asarray(buoy['stamp'], dtype=np.int64), return_index=True)
+        lat = np.interp(grid, stamps, np.asarray(buoy['lat'])[first])
+        lon = np.interp(grid, stamps, np.asarray(buoy['lon'])[first])
+        ends.append(project(lat, lon, *origin))
+    return tuple(ends)
+
+
+def line_crossings(tracks, line, wind=None):
+    """
+    (schepen x tijd): True op het gridpunt waarop een schip de lijn tussen
+    de twee boeien passeert (ten opzichte van het vorige gridpunt). Met
+    `wind` (radialen) tellen alleen passages naar de loefzijde van de lijn.
+    """
+    (x1, y1), (x2, y2) = line
+    dx, dy = x2 - x1, y2 - y1
+    side = np.sign(dx * (tracks['y'] - y1) - dy * (tracks['x'] - x1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        along = ((tracks['x'] - x1) * dx + (tracks['y'] - y1) * dy) / (dx * dx + dy * dy)
+    crossed = np.zeros(side.shape, dtype=bool)
+    crossed[:, 1:] = ((side[:, 1:] != side[:, :-1]) & tracks['valid'][:, 1:] & tracks['valid'][:, :-1] &
+                      (along[:, 1:] >= 0) & (along[:, 1:] <= 1))
+    if wind is not None:
+        crossed &= side == np.sign(dx * np.cos(wind) - dy * np.sin(wind))
+    return crossed
+
+
+def race_start(data, grid, tracks, wind, window=START_WINDOW):
+    """
+    Het echte startmoment: het eerste gridpunt vanaf waar minstens de helft
+    van de vloot binnen `window` seconden de startlijn richting de wind
+    passeert. Zonder
+    startlijn of zo'n moment is het de starttijd uit de data.
+    """
+    line = buoy_line(data, 'Start', grid, tracks['origin'])
+    if line is None:
+        return int(grid[0])
+    crossed = line_crossings(tracks, line, wind)
+    step = int(grid[1] - grid[0]) if len(grid) > 1 else 1
+    w = max(1, window // step)
+    # Per gridpunt: passeert het schip de lijn in het venster dat daar begint?
+    ahead = np.cumsum(crossed[:, ::-1], axis=1)[:, ::-1]
+    in_window = ahead - np.pad(ahead[:, w:], ((0, 0), (0, w))) > 0
+    enough = np.flatnonzero(in_window.sum(axis=0) * 2 >= len(tracks['names']))
+    if len(enough) == 0:
+        return int(grid[0])
+    first = enough[0]
+    # Het startmoment is de eerste passage binnen dat venster
+    return int(grid[first + crossed[:, first:first + w].any(axis=0).argmax()])
+
+
+def finish_times(data, grid, tracks, start):
+    """
+    Finish per schip: de laatste passage van de finishlijn na de start;
+    zonder finishlijn of passage het einde van de wedstrijd.
+    """
+    finish = np.full(len(tracks['names']), int(grid[-1]), dtype=np.int64)
+    line = buoy_line(data, 'Finish', grid, tracks['origin'])
+    if line is None:
+        return finish
+    crossed = line_crossings(tracks, line) & (grid > start)
+    has = crossed.any(axis=1)
+    last = crossed.shape[1] - 1 - crossed[:, ::-1].argmax(axis=1)
+    finish[has] = grid[last[has]]
+    return finish
+
+
+def centered_mean(values, window):
+    """Gecentreerd schuivend gemiddelde over `window` samples langs de laatste as, NaN-bestendig."""
+    values = np.asarray(values, dtype=float)
+    half = window // 2
+    pad = [(0, 0)] * (values.ndim - 1) + [(half + 1, window - 1 - half)]
+    total = np.cumsum(np.pad(np.nan_to_num(values), pad), axis=-1)
+    count = np.cumsum(np.pad((~np.isnan(values)).astype(float), pad), axis=-1)
+    total = total[..., window:] - total[..., :-window]
+    count = count[..., window:] - count[..., :-window]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return total / count
+
+
+def pair_index(n, pairs='all'):
+    """Index-arrays (a, b) van de paren; 'all' is de volle n x n matrix, 'upper' alleen a < b."""
+    a, b = np.meshgrid(np.arange(n), np.arange(n), indexing='ij')
+    if pairs == 'upper':
+        keep = a < b
+        return a[keep], b[keep]
+    return a.ravel(), b.ravel()
+
+
+def compare_race(data, step=5, pairs='all', max_gap=MAX_GAP):
+    """
+    Vergelijk ieder paar schepen (a, b) over de hele wedstrijd.
+
+    Alle verschillen zijn 'a min b', als arrays van (paren x tijd):
+
+    - 'gain': cumulatieve winst van a op b in meters sinds de start. Per
+      tijdstap telt het verschil in afgelegde afstand richting de wind
+      (aan de wind) of van de wind af (voor de wind), alleen als beide
+      schepen na de start en voor hun finish hetzelfde soort rak varen.
+      Positief = a heeft gewonnen, ook op de rakken voor de wind.
+    - 'lead': de loefwaartse voorsprong van a op b zelf, in meters
+    - 'speed', 'vmg': verschil in snelheid en VMG (eenheden van de data)
+    - 'course': koersverschil in graden, in [-180, 180)
+    - 'valid': beide schepen hebben op dat moment data
+    - 'racing': beide schepen varen wedstrijd (tussen start en eigen finish)
+
+    'pair' bevat de scheepsindices per rij (P x 2), 'names' de namen,
+    'start' het startmoment en 'finish' de finish per schip.
+    Zonder windtracks is er geen windrichting en volgt een ValueError.
+    """
+    if not data.get('windtracks'):
+        raise ValueError("Geen winddata in deze wedstrijd; winst richting de wind is niet te bepalen")
+    grid = time_grid(data, step)
+    tracks = align_tracks(data, grid, max_gap)
+    wind = np.radians(fleet_wind(data, grid)['direction'])
+    start = race_start(data, grid, tracks, wind)
+    finish = finish_times(data, grid, tracks, start)
+
+    # Loefwaartse positie: projectie op de eenheidsvector naar waar de wind vandaan komt
+    windward = tracks['x'] * np.sin(wind) + tracks['y'] * np.cos(wind)
+    vmg = tracks['speed'] * np.cos(np.radians(tracks['course']) - wind)
+
+    # Afstand per tijdstap richting de wind, in de wind van dat moment (geen sprongen als de wind draait)
+    made_good = np.diff(tracks['x'], axis=1) * np.sin(wind[1:]) + np.diff(tracks['y'], axis=1) * np.cos(wind[1:])
+    # Soort rak per schip: +1 aan de wind, -1 voor de wind, uit de gladgestreken VMG
+    leg = np.sign(centered_mean(np.where(tracks['valid'], vmg, np.nan), max(1, LEG_WINDOW // step)))
+    racing = (tracks['valid'] & (grid >= start) & (grid <= finish[:, None]) &
+              (tracks['speed'] >= SPEED_THRESHOLD))
+    counts = racing[:, 1:] & racing[:, :-1] & (leg[:, 1:] != 0)
+
+    a, b = pair_index(len(tracks['names']), pairs)
+    valid = tracks['valid'][a] & tracks['valid'][b]
+    same_leg = counts[a] & counts[b] & (leg[a, 1:] == leg[b, 1:])
+    step_gain = np.where(same_leg, leg[a, 1:] * (made_good[a] - made_good[b]), 0.0)
+    gain = np.concatenate([np.zeros((len(a), 1)), np.cumsum(step_gain, axis=1)], axis=1)
+    gain[~same_leg.any(axis=1)] = np.nan
+
+    return {
+        'names': tracks['names'],
+        'times': grid,
+        'start': start,
+        'finish': finish,
+        'pair': np.column_stack([a, b]),
+        'gain': gain,
+        'lead': np.where(valid, windward[a] - windward[b], np.nan),
+        'speed': np.where(valid, tracks['speed'][a] - tracks['speed'][b], np.nan),
+        'vmg': np.where(valid, vmg[a] - vmg[b], np.nan),
+        'course': np.where(valid, wrap180(tracks['course'][a] - tracks['course'][b]), np.nan),
+        'valid': valid,
+        'racing': racing[a] & racing[b],
+    }
+
+
+def head_to_head(result, team):
+    """
+    Samenvatting van `team` tegen ieder ander schip.
+
+    Lijst van dicts met de winst aan het eind, en het gemiddelde
+    snelheids-, VMG- en absolute koersverschil terwijl beide schepen
+    wedstrijd varen; gesorteerd op winst (onbekende winst achteraan).
+    """
+    names = result['names']
+    if team not in names:
+        raise ValueError(f"{team} heeft niet gevaren in deze wedstrijd")
+    team_idx = names.index(team)
+    rows = []
+    for row, (a, b) in enumerate(result['pair']):
+        racing = result['racing'][row]
+        if a != team_idx or b == team_idx or not racing.any():
+            continue
+        rows.append({
+            'opponent': names[b],
+            'gain': result['gain'][row, -1],
+            'speed': result['speed'][row, racing].mean(),
+            'vmg': result['vmg'][row, racing].mean(),
+            'course': np.abs(result['course'][row, racing]).mean(),
+        })
+    return sorted(rows, key=lambda r: -np.inf if np.isnan(r['gain']) else r['gain'], reverse=True)
+
+
+def final_gain_matrix(result):
+    """(n x n) matrix met de winst van rij-schip op kolom-schip aan het eind."""
+    n = len(result['names'])
+    matrix = np.full((n, n), np.nan)
+    a, b = result['pair'].T
+    matrix[a, b] = result['gain'][:, -1]
+    return matrix
+
+
+def compare_file(race_file, step=5, pairs='all'):
+    return compare_race(load_race_data(race_file), step, pairs)
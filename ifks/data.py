@@ -0,0 +1,151 @@
+"""
+Data laden zonder zware afhankelijkheden.
+
+Alles in deze module gebruikt alleen de standaardbibliotheek, zodat snelle
+taken (wedstrijden tonen, ranking printen) niet op pandas hoeven te wachten.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+
+DATA_DIR = Path("Data")
+RACE_PATTERN = "B-Match*.json"
+DISCOVER_PATTERN = "**/*.json"
+TEAM_NAAM = "Drie Gebroeders"
+
+# Zelfde grenzen als clean_race_data in de rapportage
+SPEED_THRESHOLD = 5
+MAX_SPEED = 200
+
+
+def load_race_data(filepath):
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
+def find_race_files(data_dir=DATA_DIR, pattern=RACE_PATTERN):
+    return sorted(Path(data_dir).glob(pattern))
+
+
+def race_name(filepath):
+    """'Data/B-Match1-Hindelopen.json' -> 'Match1-Hindelopen'"""
+    return re.sub(r'^[A-Z]{1,2}-', '', Path(filepath).stem)
+
+
+# 'IFKS-2025-08-09-Hindeloopen-Klasse-B' -> evenement 'IFKS 2025', klasse 'B'
+EVENT_ID = re.compile(r'^(?P<org>.+?)-(?P<year>\d{4})-\d{2}-\d{2}-.+-Klasse-(?P<klasse>\w+)$')
+
+
+def parse_event(filepath, data):
+    """
+    Bepaal (evenement, klasse) van een wedstrijdbestand.
+
+    Eerst uit het 'event' veld van de tracking data; anders uit de
+    bestandsnaam ('B-Match1-...' -> klasse B) en de naam van de map.
+    """
+    event_id = data.get('event', '').split(',')[0]
+    match = EVENT_ID.match(event_id)
+    if match:
+        return f"{match['org']} {match['year']}", match['klasse']
+    prefix = re.match(r'^([A-Z]{1,2})-', Path(filepath).stem)
+    return Path(filepath).parent.name, prefix.group(1) if prefix else ''
+
+
+def discover_races(data_dir=DATA_DIR, pattern=DISCOVER_PATTERN):
+    """
+    Zoek alle wedstrijdbestanden onder `data_dir`, ongeacht klasse of evenement.
+
+    Geeft een dict (evenement, klasse) -> lijst van
+    {'path', 'race', 'ships'} terug. Bestanden zonder shiptracks worden
+    overgeslagen, net als kopieën van een wedstrijd die al gevonden is.
+    """
+    groups = {}
+    seen = set()
+    for filepath in sorted(Path(data_dir).glob(pattern)):
+        try:
+            data = load_race_data(filepath)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, dict) or not data.get('shiptracks'):
+            continue
+        event_id = data.get('event') or str(filepath)
+        if event_id in seen:
+            continue
+        seen.add(event_id)
+        groups.setdefault(parse_event(filepath, data), []).append({
+            'path': filepath,
+            'race': race_name(filepath),
+            'ships': [ship['name'] for ship in data['shiptracks']],
+        })
+    return groups
+
+
+def race_summary(filepath, data=None):
+    if data is None:
+        data = load_race_data(filepath)
+    starttime = data.get('starttime', 0)
+    endtime = data.get('endtime', 0)
+    return {
+        'race': race_name(filepath),
+        'event': data.get('event', ''),
+        'start': datetime.fromtimestamp(starttime),
+        'end': datetime.fromtimestamp(endtime),
+        'duration_min': (endtime - starttime) / 60,
+        'ships': len(data.get('shiptracks', [])),
+        'windstations': len(data.get('windtracks', [])),
+    }
+
+
+def boat_names(race_files):
+    """Namen van alle schepen die in minstens één van de wedstrijden voeren."""
+    return {ship['name'] for filepath in race_files for ship in load_race_data(filepath).get('shiptracks', [])}
+
+
+def clean_speeds(ship, starttime, endtime, speed_threshold=SPEED_THRESHOLD, max_speed=MAX_SPEED):
+    """Snelheden binnen de wedstrijdtijd, gefilterd zoals clean_race_data."""
+    return [
+        speed for stamp, speed in zip(ship['stamp'], ship['speed'])
+        if starttime <= stamp <= endtime and speed_threshold <= speed <= max_speed
+    ]
+
+
+def speed_ranking(race_files):
+    """
+    Ranking op gemiddelde snelheid, overall en per wedstrijd.
+
+    Geeft (overall, per_race) terug; overall is een lijst van
+    (schip, gemiddelde, datapunten) en per_race een dict race -> lijst van
+    (schip, gemiddelde), beide aflopend gesorteerd.
+    """
+    totals = {}
+    per_race = {}
+    for filepath in race_files:
+        data = load_race_data(filepath)
+        starttime = data.get('starttime', 0)
+        endtime = data.get('endtime', 0)
+        race_speeds = []
+        for ship in data.get('shiptracks', []):
+            speeds = clean_speeds(ship, starttime, endtime)
+            if not speeds:
+                continue
+            race_speeds.append((ship['name'], sum(speeds) / len(speeds)))
+            total, count = totals.get(ship['name'], (0, 0))
+            totals[ship['name']] = (total + sum(speeds), count + len(speeds))
+        per_race[race_name(filepath)] = sorted(race_speeds, key=lambda item: item[1], reverse=True)
+
+    overall = [(name, total / count, count) for name, (total, count) in totals.items()]
+    overall.sort(key=lambda item: item[1], reverse=True)
+    return overall, per_race
+
+
+def print_all_keys(obj, prefix=''):
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            full_key = f"{prefix}.{key}" if prefix else key
+            print(full_key)
+            print_all_keys(value, full_key)
+    elif isinstance(obj, list):
+        for i, item in enumerate(obj):
+            print_all_keys(item, f"{prefix}[{i}]")
@@ -0,0 +1,148 @@
+"""
+Interactief HTML rapport voor alle schepen en wedstrijden tegelijk.
+
+Eén keer rekenen levert compacte aggregaten per (schip, wedstrijd,
+windhoek-bin): aantallen en sommen, zodat de browser ieder filter (ander
+schip, andere wedstrijd, andere windhoeken) zelf kan optellen. De tabellen
+worden kolomsgewijs als base64-gecodeerde typed arrays in de pagina gezet
+en de grafieken worden in de browser getekend.
+"""
+
+import base64
+import json
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from ifks.compare import compare_race, final_gain_matrix
+from ifks.data import (DATA_DIR, MAX_SPEED, SPEED_THRESHOLD, TEAM_NAAM, find_race_files,
+                       load_race_data, race_name)
+from ifks.wind import analyse_race, nearest_sample, sample_times, wrap180
+
+TEMPLATE = Path(__file__).parent / "templates" / "report.html"
+HTML_PATH = Path("rapport.html")
+TWA_BINS = np.arange(0, 190, 10)  # zelfde bins als het polar diagram
+
+
+def pack(array, dtype):
+    """Typed array als {'dtype', 'shape', 'data'} met little-endian base64 data."""
+    array = np.ascontiguousarray(array, dtype=np.dtype(dtype).newbyteorder('<'))
+    return {
+        'dtype': np.dtype(dtype).name,
+        'shape': list(array.shape),
+        'data': base64.b64encode(array.tobytes()).decode('ascii'),
+    }
+
+
+def nearest_wind(data, stamps):
+    """
+    Windrichting en -snelheid bij iedere meting: het stationsgemiddelde op
+    het dichtstbijzijnde windtijdstip, net als compute_twa in het rapport.
+    """
+    times = sample_times(data)
+    if len(times) == 0:
+        return None, None
+    wind_stamps = np.concatenate([w['stamp'] for w in data['windtracks']])
+    directions = np.concatenate([w['course'] for w in data['windtracks']])
+    speeds = np.concatenate([w['speed'] for w in data['windtracks']])
+    keep = np.isin(wind_stamps, times)
+    inverse = np.searchsorted(times, wind_stamps[keep])
+    rad = np.radians(directions[keep])
+    mean_dir = np.degrees(np.arctan2(np.bincount(inverse, np.sin(rad)),
+                                     np.bincount(inverse, np.cos(rad)))) % 360
+    mean_speed = np.bincount(inverse, speeds[keep]) / np.bincount(inverse)
+    nearest = nearest_sample(times, stamps)
+    return mean_dir[nearest], mean_speed[nearest]
+
+
+def build_bundle(race_files):
+    """
+    Bereken alle aggregaten voor alle schepen en wedstrijden.
+
+    Arrays met index [schip, wedstrijd(, bin)]:
+    - speed: aantal, som, kwadratensom en maximum van de snelheid
+    - twa: per windhoek-bin aantal, som snelheid, kwadratensom en som VMG
+      (snelheid * cos(TWA); aan de wind positief, voor de wind negatief)
+    - shifts: metingen aan de wind, waarvan opgelopen en gekrompen
+    - gain: [wedstrijd, schip, schip] winst richting de wind aan het eind
+    """
+    races = [load_race_data(f) for f in race_files]
+    race_names = [race_name(f) for f in race_files]
+    boats = sorted({ship['name'] for data in races for ship in data['shiptracks']})
+    boat_idx = {name: i for i, name in enumerate(boats)}
+    n_bins = len(TWA_BINS) - 1
+
+    speed = np.zeros((len(boats), len(races), 4))
+    twa = np.zeros((len(boats), len(races), n_bins, 4))
+    shifts = np.zeros((len(boats), len(races), 3))
+    gain = np.full((len(races), len(boats), len(boats)), np.nan)
+    race_info = []
+
+    for r, data in enumerate(races):
+        starttime, endtime = data.get('starttime', 0), data.get('endtime', 0)
+        race_info.append({
+            'name': race_names[r],
+            'start': datetime.fromtimestamp(starttime).strftime('%d-%m-%Y %H:%M'),
+            'duration_min': round((endtime - starttime) / 60),
+        })
+
+        for ship in data['shiptracks']:
+            b = boat_idx[ship['name']]
+            stamps = np.asarray(ship['stamp'])
+            spd = np.asarray(ship['speed'], dtype=float)
+            keep = (stamps >= starttime) & (stamps <= endtime) & (spd >= SPEED_THRESHOLD) & (spd <= MAX_SPEED)
+            if not keep.any():
+                continue
+            stamps, spd = stamps[keep], spd[keep]
+            course = np.asarray(ship['course'], dtype=float)[keep]
+            speed[b, r] = [len(spd), spd.sum(), (spd ** 2).sum(), spd.max()]
+
+            if not data.get('windtracks'):
+                continue
+            wind_dir, _ = nearest_wind(data, stamps)
+            if wind_dir is None:
+                continue
+            angle = np.abs(wrap180(course - wind_dir))
+            bins = np.clip(np.digitize(angle, TWA_BINS) - 1, 0, n_bins - 1)
+            vmg = spd * np.cos(np.radians(angle))
+            twa[b, r, :, 0] = np.bincount(bins, minlength=n_bins)
+            twa[b, r, :, 1] = np.bincount(bins, spd, minlength=n_bins)
+            twa[b, r, :, 2] = np.bincount(bins, spd ** 2, minlength=n_bins)
+            twa[b, r, :, 3] = np.bincount(bins, vmg, minlength=n_bins)
+
+        if data.get('windtracks'):
+            for name, usage in analyse_race(data)['usage'].items():
+                shifts[boat_idx[name], r] = [usage['upwind'], usage['lifted'], usage['headed']]
+            result = compare_race(data)
+            idx = [boat_idx[name] for name in result['names']]
+            gain[r][np.ix_(idx, idx)] = final_gain_matrix(result)
+
+    return {
+        'generated': datetime.now().strftime('%d-%m-%Y %H:%M'),
+        'boats': boats,
+        'races': race_info,
+        'twa_bins': TWA_BINS.tolist(),
+        'speed': pack(speed, 'float32'),
+        'twa': pack(twa, 'float32'),
+        'shifts': pack(shifts, 'uint32'),
+        'gain': pack(gain, 'float32'),
+    }
+
+
+def generate_html_report(team=TEAM_NAAM, race_files=None, output=HTML_PATH):
+    """
+    Schrijf één zelfstandig HTML bestand met alle schepen en wedstrijden;
+    `team` is het schip dat bij openen geselecteerd is.
+    """
+    if race_files is None:
+        race_files = find_race_files(DATA_DIR)
+    bundle = build_bundle(race_files)
+    if team not in bundle['boats']:
+        raise ValueError(f"{team} heeft niet gevaren in deze wedstrijden")
+    bundle['team'] = team
+    # '</' mag niet in een <script> blok voorkomen
+    payload = json.dumps(bundle, separators=(',', ':'), ensure_ascii=False).replace('</', '<\\/')
+    html = TEMPLATE.read_text(encoding='utf-8').replace('__BUNDLE__', payload)
+    Path(output).write_text(html, encoding='utf-8')
+    return output
@@ -0,0 +1,104 @@
+"""
+Kaarten van de gevaren tracks (folium) en gemiddelde snelheid per schip (geopy).
+"""
+
+import folium
+import matplotlib
+import matplotlib.pyplot as plt
+from geopy.distance import geodesic
+
+from ifks.data import load_race_data
+
+COLORS = [
+    "red", "blue", "green", "purple", "orange", "darkred",
+    "lightred", "darkblue", "darkgreen", "cadetblue", "darkpurple",
+    "white", "black", "pink"
+]
+
+
+def filter_tracks(tracks, start_time=None, end_time=None):
+    """Beperk tracks tot [start_time, end_time]; lege tracks vallen weg."""
+    processed = []
+    for track in tracks:
+        keep = [
+            i for i, timestamp in enumerate(track["stamp"])
+            if (start_time is None or timestamp >= start_time) and
+               (end_time is None or timestamp <= end_time)
+        ]
+        if keep:  # Only add if there's data within the time range
+            processed.append({
+                "name": track["name"],
+                "lat": [track["lat"][i] for i in keep],
+                "lon": [track["lon"][i] for i in keep],
+                "stamp": [track["stamp"][i] for i in keep],
+            })
+    return processed
+
+
+def track_map(race_file, output, start_time=None, end_time=None, buoys=False):
+    data = load_race_data(race_file)
+    shiptracks = filter_tracks(data["shiptracks"], start_time, end_time)
+
+    lats = []
+    lons = []
+    for ship in shiptracks:
+        lats.extend(ship["lat"])
+        lons.extend(ship["lon"])
+
+    center_lat = sum(lats) / len(lats) if lats else 0
+    center_lon = sum(lons) / len(lons) if lons else 0
+
+    m = folium.Map(location=[center_lat, center_lon], zoom_start=12)
+
+    for i, ship in enumerate(shiptracks):
+        points = list(zip(ship["lat"], ship["lon"]))
+        color = COLORS[i % len(COLORS)]
+        folium.PolyLine(points, color=color, weight=2.5, opacity=1, tooltip=ship["name"]).add_to(m)
+
+    if buoys:
+        for buoy in filter_tracks(data.get("buoytracks", []), start_time, end_time):
+            points = list(zip(buoy["lat"], buoy["lon"]))
+            folium.PolyLine(points, color='black', weight=2.5, opacity=1, tooltip="boei").add_to(m)
+
+    m.save(str(output))
+    return shiptracks
+
+
+def average_speeds(shiptracks):
+    """Gemiddelde snelheid in knopen over de afgelegde (geodetische) afstand."""
+    speeds = {}
+    for ship in shiptracks:
+        total_distance_km = 0
+        total_time_seconds = 0
+
+        for i in range(len(ship["lat"]) - 1):
+            coords_1 = (ship["lat"][i], ship["lon"][i])
+            coords_2 = (ship["lat"][i+1], ship["lon"][i+1])
+
+            total_distance_km += geodesic(coords_1, coords_2).km
+            total_time_seconds += ship["stamp"][i+1] - ship["stamp"][i]
+
+        if total_time_seconds > 0:
+            # Speed in km/h
+            speed_kmh = (total_distance_km / total_time_seconds) * 3600
+            # Convert to knots (1 knot = 1.852 km/h)
+            speeds[ship["name"]] = speed_kmh / 1.852
+    return speeds
+
+
+def average_speed_chart(speeds, output):
+    if not speeds:
+        return
+    matplotlib.use('Agg')
+    ship_names = list(speeds.keys())
+    avg_speeds = list(speeds.values())
+
+    plt.figure(figsize=(12, 6))
+    plt.bar(ship_names, avg_speeds, color="skyblue")
+    plt.xlabel("Ship Name")
+    plt.ylabel("Average Speed (knots)")
+    plt.title("Average Speed per Ship")
+    plt.xticks(rotation=45, ha="right")
+    plt.tight_layout()
+    plt.savefig(output)
+    plt.close()
@@ -0,0 +1,675 @@
+"""
+Genereer een Markdown rapport met alle analyses voor één team.
+"""
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from ifks import wind
+from ifks.data import (DATA_DIR, MAX_SPEED, SPEED_THRESHOLD, TEAM_NAAM, find_race_files,
+                       load_race_data, race_name)
+
+OUTPUT_DIR = Path("rapport_output")
+REPORT_PATH = Path("rapport_drie_gebroeders.md")
+
+TEAM_COLOR = '#1f77b4'
+OTHER_COLOR = '#cccccc'
+
+
+def setup_style():
+    # Pas hier, niet bij het importeren: anders verandert de backend ook voor notebooks
+    matplotlib.use('Agg')
+    plt.style.use('seaborn-v0_8-whitegrid')
+    plt.rcParams['figure.dpi'] = 150
+    plt.rcParams['savefig.dpi'] = 150
+    plt.rcParams['font.size'] = 10
+
+
+# =============================================================================
+# DATA LADEN
+# =============================================================================
+
+def ship_to_dataframe(ship_data, race_name):
+    df = pd.DataFrame({
+        'timestamp': ship_data['stamp'],
+        'lat': ship_data['lat'],
+        'lon': ship_data['lon'],
+        'speed': ship_data['speed'],
+        'course': ship_data['course']
+    })
+    df['ship_name'] = ship_data['name']
+    df['race'] = race_name
+    df['datetime'] = pd.to_datetime(df['timestamp'], unit='s')
+    return df
+
+def wind_to_dataframe(wind_data):
+    df = pd.DataFrame({
+        'timestamp': wind_data['stamp'],
+        'lat': wind_data['lat'],
+        'lon': wind_data['lon'],
+        'wind_speed': wind_data['speed'],
+        'wind_direction': wind_data['course']
+    })
+    df['station'] = wind_data['name']
+    return df
+
+def clean_race_data(df, starttime, endtime, speed_threshold=SPEED_THRESHOLD, max_speed=MAX_SPEED):
+    df_clean = df[(df['timestamp'] >= starttime) & (df['timestamp'] <= endtime)].copy()
+    df_clean = df_clean[df_clean['speed'] >= speed_threshold]
+    df_clean = df_clean[df_clean['speed'] <= max_speed]
+    return df_clean
+
+def calculate_twa(course, wind_direction):
+    diff = abs(course - wind_direction)
+    if diff > 180:
+        diff = 360 - diff
+    return diff
+
+def load_races(race_files):
+    """
+    Lees alle wedstrijden in; geeft (all_races, all_wind, race_info) terug.
+
+    Iedere entry in race_info bewaart ook de ingelezen JSON onder 'data'.
+    """
+    all_races = {}
+    all_wind = {}
+    race_info = []
+
+    for filepath in race_files:
+        name = race_name(filepath)
+        data = load_race_data(filepath)
+
+        starttime = data.get('starttime', 0)
+        endtime = data.get('endtime', 0)
+
+        race_info.append({
+            'race': name,
+            'start': datetime.fromtimestamp(starttime),
+            'end': datetime.fromtimestamp(endtime),
+            'duration_min': (endtime - starttime) / 60,
+            'data': data,
+        })
+
+        ships_df = []
+        for ship in data.get('shiptracks', []):
+            df = ship_to_dataframe(ship, name)
+            df_clean = clean_race_data(df, starttime, endtime)
+            if len(df_clean) > 0:
+                ships_df.append(df_clean)
+
+        all_races[name] = pd.concat(ships_df, ignore_index=True) if ships_df else pd.DataFrame()
+
+        wind_df = []
+        for windtrack in data.get('windtracks', []):
+            df = wind_to_dataframe(windtrack)
+            df = df[(df['timestamp'] >= starttime) & (df['timestamp'] <= endtime)]
+            if len(df) > 0:
+                wind_df.append(df)
+
+        all_wind[name] = pd.concat(wind_df, ignore_index=True) if wind_df else pd.DataFrame()
+
+    return all_races, all_wind, race_info
+
+# =============================================================================
+# ANALYSE 1: SNELHEID PER WEDSTRIJD
+# =============================================================================
+
+def analyse_speed_per_race(df_all, team, output_dir):
+    speed_stats = df_all.groupby(['race', 'ship_name'])['speed'].agg(['mean', 'max', 'std']).reset_index()
+    speed_stats.columns = ['race', 'ship_name', 'avg_speed', 'max_speed', 'std_speed']
+
+    team_speeds = speed_stats[speed_stats['ship_name'] == team].set_index('race')
+    fleet_avg = speed_stats.groupby('race')['avg_speed'].mean()
+
+    fig, ax = plt.subplots(figsize=(12, 6))
+    races = sorted(df_all['race'].unique())
+    x = range(len(races))
+
+    fleet_values = [fleet_avg.get(r, 0) for r in races]
+    ax.bar([i - 0.2 for i in x], fleet_values, 0.4, label='Vloot gemiddelde', color=OTHER_COLOR)
+
+    team_values = [team_speeds.loc[r, 'avg_speed'] if r in team_speeds.index else 0 for r in races]
+    ax.bar([i + 0.2 for i in x], team_values, 0.4, label=team, color=TEAM_COLOR)
+
+    ax.set_xlabel('Wedstrijd')
+    ax.set_ylabel('Gemiddelde snelheid')
+    ax.set_title(f'Gemiddelde Snelheid per Wedstrijd: {team} vs Vloot')
+    ax.set_xticks(x)
+    ax.set_xticklabels([r.replace('Match', 'M') for r in races], rotation=45, ha='right')
+    ax.legend()
+    ax.grid(axis='y', alpha=0.3)
+    plt.tight_layout()
+    plt.savefig(output_dir / '1_snelheid_per_wedstrijd.png', bbox_inches='tight')
+    plt.close()
+
+    return team_speeds, fleet_avg
+
+# =============================================================================
+# ANALYSE 2: TRUE WIND ANGLE
+# =============================================================================
+
+def compute_twa(all_races, all_wind, team):
+    twa_data = []
+
+    for race_name in all_races.keys():
+        race_df = all_races[race_name]
+        wind_df = all_wind[race_name]
+
+        if len(wind_df) == 0:
+            continue
+
+        team_race = race_df[race_df['ship_name'] == team].copy()
+
+        avg_wind_dir = wind_df.groupby('timestamp')['wind_direction'].apply(
+            lambda x: np.degrees(np.arctan2(np.mean(np.sin(np.radians(x))), np.mean(np.cos(np.radians(x))))) % 360
+        )
+        avg_wind_speed = wind_df.groupby('timestamp')['wind_speed'].mean()
+
+        for _, row in team_race.iterrows():
+            closest_ts = avg_wind_dir.index[np.abs(avg_wind_dir.index - row['timestamp']).argmin()]
+            wind_dir = avg_wind_dir[closest_ts]
+            wind_spd = avg_wind_speed.get(closest_ts, np.nan)
+
+            twa = calculate_twa(row['course'], wind_dir)
+
+            twa_data.append({
+                'race': race_name,
+                'timestamp': row['timestamp'],
+                'speed': row['speed'],
+                'course': row['course'],
+                'wind_direction': wind_dir,
+                'wind_speed': wind_spd,
+                'twa': twa
+            })
+
+    return pd.DataFrame(twa_data)
+
+def analyse_twa(df_twa, team, output_dir):
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    ax1 = axes[0]
+    ax1.hist(df_twa['twa'], bins=36, range=(0, 180), color=TEAM_COLOR, edgecolor='white', alpha=0.7)
+    ax1.axvline(45, color='red', linestyle='--', label='Aan de wind (45°)')
+    ax1.axvline(90, color='orange', linestyle='--', label='Halve wind (90°)')
+    ax1.axvline(135, color='green', linestyle='--', label='Ruime wind (135°)')
+    ax1.set_xlabel('True Wind Angle (graden)')
+    ax1.set_ylabel('Frequentie')
+    ax1.set_title(f'Verdeling Windhoek - {team}')
+    ax1.legend()
+
+    ax2 = axes[1]
+    df_twa.boxplot(column='twa', by='race', ax=ax2)
+    ax2.set_xlabel('Wedstrijd')
+    ax2.set_ylabel('True Wind Angle (graden)')
+    ax2.set_title(f'Windhoek per Wedstrijd')
+    plt.suptitle('')
+
+    plt.tight_layout()
+    plt.savefig(output_dir / '2_windhoek_analyse.png', bbox_inches='tight')
+    plt.close()
+
+# =============================================================================
+# ANALYSE 3: POLAR DIAGRAM
+# =============================================================================
+
+def analyse_polar(df_twa, team, output_dir):
+    df_twa['twa_bin'] = pd.cut(df_twa['twa'], bins=range(0, 190, 10), labels=range(5, 185, 10))
+    polar_data = df_twa.groupby('twa_bin', observed=True)['speed'].agg(['mean', 'std', 'count']).reset_index()
+    polar_data.columns = ['twa', 'avg_speed', 'std_speed', 'count']
+    polar_data['twa'] = polar_data['twa'].astype(float)
+    polar_data = polar_data[polar_data['count'] >= 10]
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+
+    ax1 = axes[0]
+    ax1.fill_between(polar_data['twa'],
+                      polar_data['avg_speed'] - polar_data['std_speed'],
+                      polar_data['avg_speed'] + polar_data['std_speed'],
+                      alpha=0.3, color=TEAM_COLOR)
+    ax1.plot(polar_data['twa'], polar_data['avg_speed'], 'o-', color=TEAM_COLOR, linewidth=2)
+    ax1.set_xlabel('True Wind Angle (graden)')
+    ax1.set_ylabel('Gemiddelde Snelheid')
+    ax1.set_title(f'Snelheid vs Windhoek - {team}')
+    ax1.grid(alpha=0.3)
+    ax1.set_xlim(0, 180)
+
+    ax2 = plt.subplot(122, projection='polar')
+    theta = np.radians(polar_data['twa'])
+    r = polar_data['avg_speed']
+    ax2.plot(theta, r, 'o-', color=TEAM_COLOR, linewidth=2, label='Stuurboord')
+    ax2.plot(-theta, r, 'o-', color=TEAM_COLOR, linewidth=2, alpha=0.5, label='Bakboord')
+    ax2.set_theta_zero_location('N')
+    ax2.set_theta_direction(-1)
+    ax2.set_thetamin(-180)
+    ax2.set_thetamax(180)
+    ax2.set_title(f'Polar Diagram - {team}', pad=20)
+
+    plt.tight_layout()
+    plt.savefig(output_dir / '3_polar_diagram.png', bbox_inches='tight')
+    plt.close()
+
+    return polar_data
+
+# =============================================================================
+# ANALYSE 4: RANKING
+# =============================================================================
+
+def analyse_ranking(df_all, team, output_dir):
+    overall_speed = df_all.groupby('ship_name')['speed'].agg(['mean', 'max', 'std', 'count']).reset_index()
+    overall_speed.columns = ['ship_name', 'avg_speed', 'max_speed', 'std_speed', 'data_points']
+    overall_speed = overall_speed.sort_values('avg_speed', ascending=False)
+    overall_speed['rank'] = range(1, len(overall_speed) + 1)
+
+    team_rank = overall_speed[overall_speed['ship_name'] == team]['rank'].values[0]
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    colors = [TEAM_COLOR if name == team else OTHER_COLOR for name in overall_speed['ship_name']]
+    ax.barh(overall_speed['ship_name'], overall_speed['avg_speed'], color=colors)
+
+    team_speed = overall_speed[overall_speed['ship_name'] == team]['avg_speed'].values[0]
+    ax.axvline(team_speed, color='red', linestyle='--', alpha=0.5)
+
+    ax.set_xlabel('Gemiddelde Snelheid')
+    ax.set_ylabel('Schip')
+    ax.set_title(f'Snelheidsranking - {team} staat #{team_rank}')
+    ax.invert_yaxis()
+    ax.grid(axis='x', alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output_dir / '4_ranking.png', bbox_inches='tight')
+    plt.close()
+
+    # Ranking per wedstrijd
+    race_rankings = []
+    for race in df_all['race'].unique():
+        race_speeds = df_all[df_all['race'] == race].groupby('ship_name')['speed'].mean().sort_values(ascending=False)
+        for rank, (ship, speed) in enumerate(race_speeds.items(), 1):
+            race_rankings.append({'race': race, 'ship_name': ship, 'avg_speed': speed, 'rank': rank})
+
+    df_rankings = pd.DataFrame(race_rankings)
+    team_rankings = df_rankings[df_rankings['ship_name'] == team].sort_values('race')
+
+    fig, ax = plt.subplots(figsize=(12, 5))
+    races = sorted(team_rankings['race'].unique())
+    ranks = [team_rankings[team_rankings['race'] == r]['rank'].values[0] for r in races]
+
+    ax.plot(races, ranks, 'o-', color=TEAM_COLOR, linewidth=2, markersize=10)
+    ax.axhline(y=np.mean(ranks), color='red', linestyle='--', alpha=0.5, label=f'Gemiddelde: {np.mean(ranks):.1f}')
+
+    ax.set_xlabel('Wedstrijd')
+    ax.set_ylabel('Ranking (lager is beter)')
+    ax.set_title(f'Ranking per Wedstrijd - {team}')
+    ax.invert_yaxis()
+    ax.set_ylim(16.5, 0.5)
+    ax.set_yticks(range(1, 17))
+    ax.legend()
+    ax.grid(alpha=0.3)
+
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    plt.savefig(output_dir / '5_ranking_per_wedstrijd.png', bbox_inches='tight')
+    plt.close()
+
+    return overall_speed, team_rank, df_rankings, races, ranks
+
+# =============================================================================
+# ANALYSE 5: VMG
+# =============================================================================
+
+def analyse_vmg(df_twa, team, output_dir):
+    df_twa['vmg_upwind'] = df_twa['speed'] * np.cos(np.radians(df_twa['twa']))
+    df_twa['vmg_downwind'] = df_twa['speed'] * np.cos(np.radians(180 - df_twa['twa']))
+    df_twa['sailing_mode'] = np.where(df_twa['twa'] < 90, 'Upwind', 'Downwind')
+
+    vmg_by_twa = df_twa.groupby('twa_bin', observed=True).agg({
+        'vmg_upwind': 'mean',
+        'vmg_downwind': 'mean',
+        'speed': 'mean',
+        'twa': 'count'
+    }).reset_index()
+    vmg_by_twa.columns = ['twa_bin', 'vmg_upwind', 'vmg_downwind', 'boat_speed', 'count']
+    vmg_by_twa['twa'] = vmg_by_twa['twa_bin'].astype(float)
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    ax1 = axes[0]
+    upwind_data = vmg_by_twa[vmg_by_twa['twa'] < 90]
+    downwind_data = vmg_by_twa[vmg_by_twa['twa'] >= 90]
+
+    ax1.plot(upwind_data['twa'], upwind_data['vmg_upwind'], 'o-', color='blue', label='Upwind VMG', linewidth=2)
+    ax1.plot(downwind_data['twa'], downwind_data['vmg_downwind'], 'o-', color='red', label='Downwind VMG', linewidth=2)
+    ax1.axhline(0, color='gray', linestyle='-', alpha=0.3)
+    ax1.set_xlabel('True Wind Angle (graden)')
+    ax1.set_ylabel('VMG')
+    ax1.set_title(f'VMG vs Windhoek - {team}')
+    ax1.legend()
+    ax1.grid(alpha=0.3)
+
+    ax2 = axes[1]
+    upwind = df_twa[df_twa['sailing_mode'] == 'Upwind']['vmg_upwind']
+    downwind = df_twa[df_twa['sailing_mode'] == 'Downwind']['vmg_downwind']
+
+    ax2.hist(upwind, bins=30, alpha=0.7, label=f'Upwind VMG (gem: {upwind.mean():.1f})', color='blue')
+    ax2.hist(downwind, bins=30, alpha=0.7, label=f'Downwind VMG (gem: {downwind.mean():.1f})', color='red')
+    ax2.set_xlabel('VMG')
+    ax2.set_ylabel('Frequentie')
+    ax2.set_title(f'VMG Distributie - {team}')
+    ax2.legend()
+
+    plt.tight_layout()
+    plt.savefig(output_dir / '6_vmg_analyse.png', bbox_inches='tight')
+    plt.close()
+
+    return vmg_by_twa, upwind_data, downwind_data
+
+# =============================================================================
+# ANALYSE 6: WINDSHIFTS
+# =============================================================================
+
+def analyse_windshifts(race_info, team, output_dir):
+    shift_rows = []
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    ax1 = axes[0]
+
+    for info in race_info:
+        race, data = info['race'], info['data']
+        result = wind.analyse_race(data)
+        fleet_wind = result['wind']
+        minutes = (fleet_wind['times'] - data['starttime']) / 60
+        deviation = wind.wrap180(fleet_wind['direction'] - result['reference'])
+        line, = ax1.plot(minutes, deviation, '.-', label=race.replace('Match', 'M'))
+        for shift in result['shifts']:
+            t = (shift['time'] - data['starttime']) / 60
+            ax1.plot(t, np.interp(t, minutes, deviation), 'o', color=line.get_color())
+
+        usage = result['usage']
+        fleet_lifted = [u['lifted'] / u['upwind'] * 100 for u in usage.values() if u['upwind'] > 0]
+        team_usage = usage.get(team)
+        if not team_usage or team_usage['upwind'] == 0:
+            continue
+        shift_rows.append({
+            'race': race,
+            'shifts': len(result['shifts']),
+            'veers': sum(s['kind'] == 'ruimend' for s in result['shifts']),
+            'gusts': result['gusts'],
+            'lulls': result['lulls'],
+            'lifted_pct': team_usage['lifted'] / team_usage['upwind'] * 100,
+            'headed_pct': team_usage['headed'] / team_usage['upwind'] * 100,
+            'fleet_lifted_pct': np.mean(fleet_lifted),
+            'vmg_lifted': team_usage['vmg_lifted'],
+            'vmg_headed': team_usage['vmg_headed'],
+        })
+
+    ax1.axhline(0, color='gray', linestyle='-', alpha=0.3)
+    ax1.set_xlabel('Minuten na de start')
+    ax1.set_ylabel('Afwijking van gemiddelde windrichting (graden)')
+    ax1.set_title('Windrichting per Wedstrijd (punten = shifts)')
+    ax1.legend(fontsize=8)
+    ax1.grid(alpha=0.3)
+
+    df_shifts = pd.DataFrame(shift_rows)
+
+    ax2 = axes[1]
+    if len(df_shifts) > 0:
+        x = range(len(df_shifts))
+        ax2.bar([i - 0.2 for i in x], df_shifts['fleet_lifted_pct'], 0.4, label='Opgelopen (vloot)', color=OTHER_COLOR)
+        ax2.bar([i + 0.2 for i in x], df_shifts['lifted_pct'], 0.4, label=f'Opgelopen ({team})', color=TEAM_COLOR)
+        ax2.plot(list(x), df_shifts['headed_pct'], 'o--', color='red', label=f'Gekrompen ({team})')
+        ax2.set_xticks(list(x))
+        ax2.set_xticklabels([r.replace('Match', 'M') for r in df_shifts['race']], rotation=45, ha='right')
+    ax2.set_xlabel('Wedstrijd')
+    ax2.set_ylabel('% van de tijd aan de wind')
+    ax2.set_title(f'Gebruik van de Shifts - {team}')
+    ax2.legend()
+    ax2.grid(axis='y', alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig(output_dir / '7_windshifts.png', bbox_inches='tight')
+    plt.close()
+
+    return df_shifts
+
+# =============================================================================
+# MARKDOWN RAPPORT GENEREREN
+# =============================================================================
+
+def _fmt(value):
+    return "-" if pd.isna(value) else f"{value:.1f}"
+
+def generate_report(team=TEAM_NAAM, race_files=None, output_dir=OUTPUT_DIR, report_path=REPORT_PATH):
+    """
+    Voer alle analyses uit voor `team` en schrijf het Markdown rapport.
+
+    De afbeeldingen komen in `output_dir`; in het rapport wordt ernaar
+    verwezen relatief aan de map van `report_path`.
+    """
+    if race_files is None:
+        race_files = find_race_files(DATA_DIR)
+    output_dir = Path(output_dir)
+    report_path = Path(report_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    img_dir = Path(os.path.relpath(output_dir, report_path.parent)).as_posix()
+
+    setup_style()
+
+    print("📊 Data laden...")
+
+    all_races, all_wind, race_info = load_races(race_files)
+
+    df_all = pd.concat(all_races.values(), ignore_index=True)
+    df_team = df_all[df_all['ship_name'] == team].copy()
+
+    print(f"✅ {len(race_files)} wedstrijden geladen")
+    print(f"✅ {len(df_team):,} datapunten voor {team}")
+
+    print("📈 Analyse 1: Snelheid per wedstrijd...")
+    team_speeds, fleet_avg = analyse_speed_per_race(df_all, team, output_dir)
+
+    print("🌬️ Analyse 2: Windhoek berekenen...")
+    df_twa = compute_twa(all_races, all_wind, team)
+    analyse_twa(df_twa, team, output_dir)
+
+    print("🧭 Analyse 3: Polar diagram...")
+    polar_data = analyse_polar(df_twa, team, output_dir)
+
+    print("🏆 Analyse 4: Ranking...")
+    overall_speed, team_rank, df_rankings, races, ranks = analyse_ranking(df_all, team, output_dir)
+
+    print("🎯 Analyse 5: VMG analyse...")
+    vmg_by_twa, upwind_data, downwind_data = analyse_vmg(df_twa, team, output_dir)
+
+    print("🌀 Analyse 6: Windshifts...")
+    df_shifts = analyse_windshifts(race_info, team, output_dir)
+
+    print("📝 Markdown rapport genereren...")
+
+    # Bereken statistieken
+    best_upwind_idx = upwind_data['vmg_upwind'].idxmax() if len(upwind_data) > 0 else None
+    best_downwind_idx = downwind_data['vmg_downwind'].idxmax() if len(downwind_data) > 0 else None
+
+    upwind_pct = (df_twa['twa'] < 90).mean() * 100
+    downwind_pct = (df_twa['twa'] >= 90).mean() * 100
+
+    speed_table = ""
+    for race in races:
+        team_avg = team_speeds.loc[race, 'avg_speed'] if race in team_speeds.index else 0
+        fleet = fleet_avg.get(race, 0)
+        diff = team_avg - fleet
+        diff_pct = (diff / fleet * 100) if fleet > 0 else 0
+        speed_table += f"| {race} | {team_avg:.1f} | {fleet:.1f} | {diff:+.1f} ({diff_pct:+.1f}%) |\n"
+
+    ranking_table = ""
+    for race, rank in zip(races, ranks):
+        total_ships = len(df_rankings[df_rankings['race'] == race])
+        ranking_table += f"| {race} | #{rank} van {total_ships} |\n"
+
+    shift_table = ""
+    for _, row in df_shifts.iterrows():
+        shift_table += (f"| {row['race']} | {row['shifts']} ({row['veers']} ruimend) | {row['gusts']} / {row['lulls']} "
+                        f"| {row['lifted_pct']:.1f}% | {row['headed_pct']:.1f}% | {row['fleet_lifted_pct']:.1f}% "
+                        f"| {_fmt(row['vmg_lifted'])} | {_fmt(row['vmg_headed'])} |\n")
+    with_shifts = df_shifts[df_shifts['shifts'] > 0] if len(df_shifts) > 0 else df_shifts
+    if len(with_shifts) > 0:
+        lifted_diff = (with_shifts['lifted_pct'] - with_shifts['fleet_lifted_pct']).mean()
+        shift_summary = (f"**In de {len(with_shifts)} wedstrijd(en) met een shift voer {team} gemiddeld "
+                         f"{lifted_diff:+.1f} procentpunt vaker opgelopen dan de vloot.**")
+    else:
+        shift_summary = "**In geen enkele wedstrijd was een shift te zien in de windmetingen.**"
+
+    markdown = f"""# IFKS 2025 Analyse Rapport
+## {team}
+
+*Gegenereerd op {datetime.now().strftime('%d-%m-%Y %H:%M')}*
+
+---
+
+## Samenvatting
+
+| Statistiek | Waarde |
+|------------|--------|
+| Wedstrijden gevaren | {len(all_races)} |
+| Totaal datapunten | {len(df_team):,} |
+| Gemiddelde snelheid | {df_team['speed'].mean():.1f} |
+| Maximum snelheid | {df_team['speed'].max():.0f} |
+| Overall ranking | #{team_rank} van {len(overall_speed)} |
+| Gemiddelde TWA | {df_twa['twa'].mean():.1f}° |
+| Upwind tijd | {upwind_pct:.1f}% |
+| Downwind tijd | {downwind_pct:.1f}% |
+
+---
+
+## 1. Snelheid per Wedstrijd
+
+Vergelijking van de gemiddelde snelheid van {team} met het vlootgemiddelde.
+
+![Snelheid per wedstrijd]({img_dir}/1_snelheid_per_wedstrijd.png)
+
+| Wedstrijd | {team} | Vloot | Verschil |
+|-----------|-------------|-------|----------|
+{speed_table}
+
+---
+
+## 2. Windhoek Analyse (True Wind Angle)
+
+De True Wind Angle (TWA) geeft aan onder welke hoek er ten opzichte van de wind wordt gevaren:
+- **0-60°**: Aan de wind (kruisen)
+- **60-120°**: Halve wind
+- **120-180°**: Ruime wind / voor de wind
+
+![Windhoek analyse]({img_dir}/2_windhoek_analyse.png)
+
+**Verdeling:**
+- Aan de wind (0-60°): {((df_twa['twa'] >= 0) & (df_twa['twa'] < 60)).mean() * 100:.1f}%
+- Halve wind (60-120°): {((df_twa['twa'] >= 60) & (df_twa['twa'] < 120)).mean() * 100:.1f}%
+- Ruime wind (120-180°): {((df_twa['twa'] >= 120) & (df_twa['twa'] <= 180)).mean() * 100:.1f}%
+
+---
+
+## 3. Polar Diagram
+
+Het polar diagram toont de gemiddelde snelheid bij verschillende windhoeken.
+
+![Polar diagram]({img_dir}/3_polar_diagram.png)
+
+**Optimale hoeken:**
+- Hoogste snelheid: {polar_data['avg_speed'].max():.1f} bij {polar_data.loc[polar_data['avg_speed'].idxmax(), 'twa']:.0f}°
+
+---
+
+## 4. Ranking
+
+### Overall Ranking (op basis van gemiddelde snelheid)
+
+![Ranking]({img_dir}/4_ranking.png)
+
+**{team} staat #{team_rank} van {len(overall_speed)} schepen.**
+
+### Ranking per Wedstrijd
+
+![Ranking per wedstrijd]({img_dir}/5_ranking_per_wedstrijd.png)
+
+| Wedstrijd | Positie |
+|-----------|---------|
+{ranking_table}
+
+**Gemiddelde ranking: {np.mean(ranks):.1f}**
+
+---
+
+## 5. VMG Analyse (Velocity Made Good)
+
+VMG meet de effectieve snelheid richting de wind:
+- **Upwind VMG**: Hoe snel je tegen de wind in komt
+- **Downwind VMG**: Hoe snel je met de wind mee komt
+
+![VMG analyse]({img_dir}/6_vmg_analyse.png)
+
+**Optimale VMG hoeken:**
+- Beste upwind hoek: {vmg_by_twa.loc[best_upwind_idx, 'twa']:.0f}° (VMG: {vmg_by_twa.loc[best_upwind_idx, 'vmg_upwind']:.1f})
+- Beste downwind hoek: {vmg_by_twa.loc[best_downwind_idx, 'twa']:.0f}° (VMG: {vmg_by_twa.loc[best_downwind_idx, 'vmg_downwind']:.1f})
+
+---
+
+## 6. Windshifts
+
+De windstations meten ongeveer eens per half uur, dus er zijn maar drie of vier metingen per
+wedstrijd. De windrichting boven de baan is per meting het gemiddelde van alle stations. Een shift
+is een verandering van minstens {wind.SHIFT_THRESHOLD}° tussen twee opeenvolgende metingen, die ook minstens
+{wind.SHIFT_SIGMA} keer de standaardfout van de veranderingen per station is (ruis van losse stations telt niet):
+- **Ruimend**: de wind draait met de klok mee
+- **Krimpend**: de wind draait tegen de klok in
+
+Na een shift is een schip aan de wind **opgelopen** als de wind verder achterlangs komt dan vóór
+de shift (het kan hoger sturen), en **gekrompen** als de wind voorlijker komt. Welke van de twee
+hangt af van de boeg. Zonder shift telt niets als opgelopen of gekrompen. Kortdurende vlagen zijn
+op deze resolutie niet te zien: een vlaag of luwte is hier een meting van een station die minstens
+{wind.GUST_FACTOR:.0%} boven of onder het eigen gemiddelde van dat station ligt.
+
+![Windshifts]({img_dir}/7_windshifts.png)
+
+| Wedstrijd | Shifts | Vlagen / luwtes | Opgelopen | Gekrompen | Opgelopen (vloot) | VMG opgelopen | VMG gekrompen |
+|-----------|--------|-----------------|-----------|-----------|-------------------|---------------|---------------|
+{shift_table}
+
+{shift_summary}
+
+---
+
+## Wedstrijdoverzicht
+
+| Wedstrijd | Datum | Locatie | Duur (min) |
+|-----------|-------|---------|------------|
+"""
+
+    for info in race_info:
+        locatie = info['race'].split('-')[-1] if '-' in info['race'] else info['race']
+        markdown += f"| {info['race']} | {info['start'].strftime('%d-%m-%Y')} | {locatie} | {info['duration_min']:.0f} |\n"
+
+    markdown += """
+---
+
+*Dit rapport is automatisch gegenereerd op basis van GPS-tracking data van de IFKS 2025.*
+"""
+
+    with open(report_path, 'w') as f:
+        f.write(markdown)
+
+    print("\n" + "="*60)
+    print("✅ RAPPORT GEREED!")
+    print("="*60)
+    print(f"\n📄 Markdown rapport: {report_path}")
+    print(f"📁 Afbeeldingen: {output_dir}/")
+    print("\nOm naar PDF te converteren:")
+    print(f"  1. Open {report_path} in VS Code")
+    print("  2. Gebruik 'Markdown PDF' extensie, of")
+    print("  3. Print naar PDF vanuit je browser")
+
+    return report_path
@@ -0,0 +1,158 @@
+"""
+Snelheid en koers van alle schepen over de tijd.
+
+Per pixelkolom worden alleen de eerste, laatste, laagste en hoogste meting
+getekend (min/max-downsampling), zodat de grafiek er hetzelfde uitziet als
+met alle punten maar veel minder lijnsegmenten bevat. De koers wordt
+ontvouwen en bij 0°/360° onderbroken, zodat die overgang geen verticale
+lijn geeft.
+Gemaakte grafieken worden per wedstrijd gecachet.
+"""
+
+import hashlib
+import shutil
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+
+from ifks.data import TEAM_NAAM, load_race_data
+
+CACHE_DIR = Path(".ifks_cache") / "plots"
+FIGSIZE = (12, 6)
+DPI = 100
+
+LABELS = {
+    'speed': ('Snelheid', 'Snelheid van de schepen over tijd', 0.2),
+    'course': ('Koers (graden)', 'Koers van de schepen over tijd', 0.3),
+}
+
+
+def minmax_downsample(x, y, buckets):
+    """
+    Indices van de punten die per bucket het beeld bepalen.
+
+    De x-as wordt in `buckets` gelijke stukken verdeeld; per stuk blijven de
+    eerste, laatste, minimale en maximale waarde over. Pieken gaan zo nooit
+    verloren, ook niet als er veel meer punten dan pixels zijn.
+    """
+    n = len(x)
+    if n <= 4 * buckets:
+        return np.arange(n)
+    edges = np.linspace(x[0], x[-1], buckets + 1)
+    starts = np.unique(np.searchsorted(x, edges[:-1], side='left'))
+    starts = starts[starts < n]
+    ends = np.append(starts[1:], n) - 1
+
+    # Sorteer binnen iedere bucket op waarde: eerste = minimum, laatste = maximum
+    bucket = np.repeat(np.arange(len(starts)), ends - starts + 1)
+    order = np.lexsort((y, bucket))
+    argmin = order[starts]
+    argmax = order[ends]
+
+    return np.unique(np.concatenate([starts, ends, argmin, argmax]))
+
+
+def unwrap_course(course):
+    """Koers zonder sprongen van 360°; de waarden kunnen buiten 0-360 komen."""
+    return np.degrees(np.unwrap(np.radians(course)))
+
+
+def break_at_wrap(times, course):
+    """
+    Vouw een ontvouwen koers terug naar 0-360 en onderbreek de lijn waar hij
+    de rand passeert, in plaats van een verticale streep over de hele as.
+    """
+    wrapped = course % 360
+    cross = np.flatnonzero(np.floor(course[1:] / 360) != np.floor(course[:-1] / 360)) + 1
+    return np.insert(times, cross, times[cross - 1]), np.insert(wrapped, cross, np.nan)
+
+
+def local_offset(stamp):
+    """Verschil met UTC in seconden, voor de lokale klok van de wedstrijd."""
+    return time.localtime(int(stamp)).tm_gmtoff
+
+
+def start_stamp(data, start_clock=None):
+    """Unix tijd van `start_clock` (HH:MM, lokale tijd) op de dag van de wedstrijd."""
+    if start_clock is None:
+        return data['starttime']
+    day = datetime.fromtimestamp(data['starttime'])
+    clock = datetime.strptime(start_clock, "%H:%M")
+    return int(day.replace(hour=clock.hour, minute=clock.minute, second=0, microsecond=0).timestamp())
+
+
+def prepare_series(ship, field, start, buckets):
+    """(tijden als datetime64, waarden) van één schip, gefilterd en gedownsampled."""
+    stamps = np.asarray(ship['stamp'], dtype=np.int64)
+    values = np.asarray(ship[field], dtype=float)
+    keep = stamps >= start
+    stamps, values = stamps[keep], values[keep]
+    if len(stamps) == 0:
+        return stamps.astype('datetime64[s]'), values
+    if field == 'course':
+        values = unwrap_course(values)
+    idx = minmax_downsample(stamps, values, buckets)
+    # Lokale kloktijd, zoals datetime.fromtimestamp die gaf
+    times = (stamps[idx] + local_offset(stamps[0])).astype('datetime64[s]')
+    if field == 'course':
+        return break_at_wrap(times, values[idx])
+    return times, values[idx]
+
+
+def cache_path(race_file, field, team, start_clock, cache_dir=CACHE_DIR):
+    """Cachebestand voor deze wedstrijd en instellingen; verandert als het bestand verandert."""
+    race_file = Path(race_file)
+    stat = race_file.stat()
+    # De tijdzone bepaalt de kloktijden op de as en wat `start_clock` betekent
+    key = (f"{race_file.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{field}|{team}|{start_clock}|"
+           f"{time.tzname}|{FIGSIZE}|{DPI}")
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return Path(cache_dir) / f"{race_file.stem}-{field}-{digest}.png"
+
+
+def plot_over_time(race_file, field, output, team=TEAM_NAAM, start_clock=None, cache_dir=CACHE_DIR):
+    """
+    Plot `field` ('speed' of 'course') van ieder schip vanaf `start_clock`
+    (standaard de start van de wedstrijd), met `team` uitgelicht.
+
+    Geeft True terug als de grafiek uit de cache kwam.
+    """
+    cached = cache_path(race_file, field, team, start_clock, cache_dir) if cache_dir else None
+    if cached is not None and cached.exists():
+        shutil.copyfile(cached, output)
+        return True
+
+    # matplotlib alleen laden als er echt getekend moet worden
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    ylabel, title, other_alpha = LABELS[field]
+    data = load_race_data(race_file)
+    start = start_stamp(data, start_clock)
+    buckets = FIGSIZE[0] * DPI
+
+    fig, ax = plt.subplots(figsize=FIGSIZE, dpi=DPI)
+
+    for ship in data['shiptracks']:
+        times, values = prepare_series(ship, field, start, buckets)
+        if ship['name'] == team:
+            ax.plot(times, values, label=ship['name'])
+        else:
+            ax.plot(times, values, label=ship['name'], alpha=other_alpha)
+
+    ax.set_xlabel('Tijd')
+    ax.set_ylabel(ylabel)
+    ax.set_title(title)
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.grid(True)
+
+    fig.savefig(output, bbox_inches='tight')
+    plt.close(fig)
+
+    if cached is not None:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(output, cached)
+    return False
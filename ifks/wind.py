@@ -0,0 +1,245 @@
+"""
+Windshifts en vlagen uit de windtracks van een wedstrijd.
+
+De windstations meten maar eens per half uur (drie of vier metingen per
+wedstrijd). Er wordt daarom niet geïnterpoleerd naar een fijn tijdgrid:
+shifts zijn veranderingen tussen twee opeenvolgende metingen, en iedere
+meting staat voor de wind van een half meetinterval ervoor tot erna. Een
+shift telt alleen als de vlootgemiddelde verandering groter is dan de
+spreiding tussen de stations verklaart. Windvlagen van seconden of minuten
+zijn op deze resolutie niet te zien; een "vlaag" is hier een meting van een
+station die ver boven het eigen wedstrijdgemiddelde ligt.
+"""
+
+import numpy as np
+
+from ifks.data import MAX_SPEED, SPEED_THRESHOLD
+
+SHIFT_THRESHOLD = 5  # graden tussen twee opeenvolgende metingen
+SHIFT_SIGMA = 2  # en minstens zoveel standaardfouten van de verandering per station
+GUST_FACTOR = 0.2  # vlaag/luwte bij 20% boven/onder het gemiddelde van het station
+LIFT_THRESHOLD = 3  # graden verschil in windhoek voor opgelopen/gekrompen
+
+VEER = 1  # ruimend: met de klok mee
+BACK = -1  # krimpend: tegen de klok in
+GUST = 1
+LULL = -1
+LIFTED = 1
+HEADED = -1
+
+
+def wrap180(angle):
+    """Hoekverschil in graden naar [-180, 180)."""
+    return (np.asarray(angle) + 180) % 360 - 180
+
+
+def interp_angle(grid, stamps, degrees):
+    """Interpoleer een richting via sin/cos, zodat 359° -> 1° niet via 180° loopt."""
+    rad = np.radians(degrees)
+    sin = np.interp(grid, stamps, np.sin(rad))
+    cos = np.interp(grid, stamps, np.cos(rad))
+    return np.degrees(np.arctan2(sin, cos)) % 360
+
+
+def circular_mean(degrees, axis=None):
+    rad = np.radians(degrees)
+    return np.degrees(np.arctan2(np.nanmean(np.sin(rad), axis=axis),
+                                 np.nanmean(np.cos(rad), axis=axis))) % 360
+
+
+def station_series(data, grid, hold=True):
+    """
+    Alle windstations op `grid`: (namen, richting, snelheid), de laatste
+    twee als arrays van (stations x tijd).
+
+    Voor de eerste en na de laatste meting van een station blijft de wind
+    gelijk, tenzij `hold` False is: dan is het daar NaN.
+    """
+    tracks = [w for w in data.get('windtracks', []) if w['stamp']]
+    direction = np.empty((len(tracks), len(grid)))
+    speed = np.empty((len(tracks), len(grid)))
+    for i, wind in enumerate(tracks):
+        stamps, first = np.unique(np.asarray(wind['stamp'], dtype=np.int64), return_index=True)
+        direction[i] = interp_angle(grid, stamps, np.asarray(wind['course'], dtype=float)[first])
+        speed[i] = np.interp(grid, stamps, np.asarray(wind['speed'], dtype=float)[first])
+        if not hold:
+            outside = (grid < stamps[0]) | (grid > stamps[-1])
+            direction[i, outside] = np.nan
+            speed[i, outside] = np.nan
+    return [w['name'] for w in tracks], direction, speed
+
+
+def fleet_wind(data, grid, hold=True):
+    """
+    Wind boven de baan: circulair gemiddelde richting en gemiddelde snelheid
+    over alle stations, plus de spreiding in richting tussen de stations.
+    """
+    names, direction, speed = station_series(data, grid, hold)
+    mean_dir = circular_mean(direction, axis=0)
+    with np.errstate(invalid='ignore'):
+        return {
+            'stations': names,
+            'times': grid,
+            'direction': mean_dir,
+            'speed': np.nanmean(speed, axis=0),
+            'spread': np.nanmean(np.abs(wrap180(direction - mean_dir)), axis=0),
+        }
+
+
+def sample_times(data):
+    """Alle meettijdstippen van de windstations binnen de wedstrijd, oplopend."""
+    stamps = [np.asarray(w['stamp'], dtype=np.int64) for w in data.get('windtracks', []) if w['stamp']]
+    if not stamps:
+        return np.empty(0, dtype=np.int64)
+    stamps = np.unique(np.concatenate(stamps))
+    return stamps[(stamps >= data['starttime']) & (stamps <= data['endtime'])]
+
+
+def sample_interval(times):
+    """Typische tijd tussen twee windmetingen in seconden (0 bij minder dan twee)."""
+    return float(np.median(np.diff(times))) if len(times) > 1 else 0.0
+
+
+def nearest_sample(times, stamps):
+    """Index van de dichtstbijzijnde windmeting voor ieder tijdstip in `stamps`."""
+    if len(times) == 1:
+        return np.zeros(len(stamps), dtype=int)
+    right = np.clip(np.searchsorted(times, stamps), 1, len(times) - 1)
+    return np.where(np.abs(times[right - 1] - stamps) <= np.abs(times[right] - stamps), right - 1, right)
+
+
+def detect_shifts(direction, threshold=SHIFT_THRESHOLD, sigma=SHIFT_SIGMA):
+    """
+    Shifts tussen opeenvolgende metingen van (stations x metingen).
+
+    Per station wordt de verandering tussen twee metingen bepaald; de shift
+    van de vloot is de verandering van het circulaire gemiddelde. Die telt
+    als hij minstens `threshold` graden is en minstens `sigma` keer de
+    standaardfout van de veranderingen per station, zodat ruis van enkele
+    stations geen shift oplevert.
+
+    Geeft (verschil in graden, label, standaardfout) per interval terug;
+    label is VEER, BACK of 0.
+    """
+    direction = np.asarray(direction, dtype=float)
+    delta = wrap180(np.diff(circular_mean(direction, axis=0)))
+    per_station = wrap180(np.diff(direction, axis=-1))
+    count = (~np.isnan(per_station)).sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(per_station, axis=0) / count
+        var = np.nansum((per_station - mean) ** 2, axis=0) / (count - 1)
+        # Met één station is de spreiding onbekend en telt alleen `threshold`
+        stderr = np.where(count > 1, np.sqrt(var / count), np.nan)
+    significant = (np.abs(delta) >= threshold) & ~(np.abs(delta) < sigma * stderr)
+    label = np.zeros(delta.shape, dtype=np.int8)
+    label[significant & (delta > 0)] = VEER
+    label[significant & (delta < 0)] = BACK
+    return delta, label, stderr
+
+
+def shift_events(times, delta, label):
+    """Eén event per shift, halverwege de twee metingen waartussen hij valt."""
+    return [{
+        'time': int((times[i] + times[i + 1]) // 2),
+        'delta': float(delta[i]),
+        'kind': 'ruimend' if label[i] == VEER else 'krimpend',
+    } for i in np.flatnonzero(label)]
+
+
+def count_runs(label, value):
+    """Aantal aaneengesloten reeksen waarin `label` gelijk is aan `value`, langs de laatste as."""
+    hit = np.asarray(label) == value
+    return int(hit[..., :1].sum() + (hit[..., 1:] & ~hit[..., :-1]).sum())
+
+
+def detect_gusts(speed, factor=GUST_FACTOR):
+    """
+    Vlagen en luwtes van (stations x metingen), t.o.v. het gemiddelde van
+    ieder station over de hele wedstrijd.
+
+    Geeft (verhouding tot het gemiddelde, label) terug; label is GUST, LULL of 0.
+    """
+    speed = np.asarray(speed, dtype=float)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ratio = speed / np.nanmean(speed, axis=-1, keepdims=True)
+    label = np.zeros(ratio.shape, dtype=np.int8)
+    label[ratio >= 1 + factor] = GUST
+    label[ratio <= 1 - factor] = LULL
+    return ratio, label
+
+
+def label_fixes(course, wind_now, wind_ref, threshold=LIFT_THRESHOLD):
+    """
+    Label iedere meting als opgelopen (LIFTED), gekrompen (HEADED) of 0.
+
+    Een schip loopt op als de wind na de shift meer van achteren komt dan
+    ervoor, dus als de ware windhoek in `wind_now` groter is dan in `wind_ref`.
+    Waar `wind_ref` NaN is (geen shift) is het label 0.
+    """
+    twa_now = np.abs(wrap180(course - wind_now))
+    twa_ref = np.abs(wrap180(course - wind_ref))
+    diff = twa_now - twa_ref
+    label = np.zeros(diff.shape, dtype=np.int8)
+    label[diff >= threshold] = LIFTED
+    label[diff <= -threshold] = HEADED
+    return label
+
+
+def analyse_race(data):
+    """
+    Shifts, vlagen en het gebruik van de shifts door iedere boot.
+
+    Iedere scheepsmeting krijgt de vlootwind van de dichtstbijzijnde
+    windmeting; metingen die meer dan een half meetinterval buiten de
+    windmetingen vallen tellen niet mee. 'usage' is per schip een dict met
+    het aantal kruisrakmetingen (TWA < 90) en hoeveel daarvan na een shift
+    opgelopen/gekrompen waren t.o.v. de wind vóór die shift, met de
+    gemiddelde VMG in beide gevallen. Zonder shift is er niets op te lopen.
+    """
+    starttime, endtime = data['starttime'], data['endtime']
+    times = sample_times(data)
+    wind = fleet_wind(data, times, hold=False)
+    names, direction, speed = station_series(data, times, hold=False)
+    interval = sample_interval(times)
+    delta, shift_label, stderr = detect_shifts(direction)
+    ratio, gust_label = detect_gusts(speed)
+
+    # Referentiewind per windmeting: de vlootwind vlak voor de laatste shift
+    last_shift = np.maximum.accumulate(np.where(shift_label != 0, np.arange(len(delta)), -1))
+    ref_index = np.concatenate([[-1], last_shift]) if len(times) else np.empty(0, dtype=int)
+    wind_ref = np.where(ref_index >= 0, wind['direction'][np.maximum(ref_index, 0)], np.nan)
+
+    usage = {}
+    for ship in data['shiptracks'] if len(times) else []:
+        stamps = np.asarray(ship['stamp'])
+        speed_ship = np.asarray(ship['speed'], dtype=float)
+        keep = ((stamps >= starttime) & (stamps <= endtime) &
+                (speed_ship >= SPEED_THRESHOLD) & (speed_ship <= MAX_SPEED))
+        keep &= (stamps >= times[0] - interval / 2) & (stamps <= times[-1] + interval / 2)
+        if not keep.any():
+            continue
+        stamps = stamps[keep]
+        course = np.asarray(ship['course'], dtype=float)[keep]
+        speed_ship = speed_ship[keep]
+        nearest = nearest_sample(times, stamps)
+        twa = np.abs(wrap180(course - wind['direction'][nearest]))
+        upwind = twa < 90
+        label = label_fixes(course, wind['direction'][nearest], wind_ref[nearest])[upwind]
+        vmg = (speed_ship * np.cos(np.radians(twa)))[upwind]
+        usage[ship['name']] = {
+            'upwind': int(upwind.sum()),
+            'lifted': int((label == LIFTED).sum()),
+            'headed': int((label == HEADED).sum()),
+            'vmg_lifted': float(vmg[label == LIFTED].mean()) if (label == LIFTED).any() else np.nan,
+            'vmg_headed': float(vmg[label == HEADED].mean()) if (label == HEADED).any() else np.nan,
+        }
+
+    return {
+        'wind': wind,
+        'reference': float(circular_mean(wind['direction'])) if len(times) else np.nan,
+        'interval': interval,
+        'shifts': shift_events(times, delta, shift_label),
+        'gusts': count_runs(gust_label, GUST),
+        'lulls': count_runs(gust_label, LULL),
+        'usage': usage,
+    }
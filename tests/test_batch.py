@@ -0,0 +1,36 @@
+import os
+
+from ifks.batch import fingerprint, is_done
+
+
+def make_job(tmp_path, race_files):
+    return {'key': 'IFKS 2025|B|Schip', 'race_files': [str(f) for f in race_files],
+            'inputs': fingerprint(race_files), 'report_path': str(tmp_path / "rapport.md")}
+
+
+def test_fingerprint_follows_the_race_files(tmp_path):
+    first, second = tmp_path / "B-Match1.json", tmp_path / "B-Match2.json"
+    first.write_text("{}")
+    second.write_text("{}")
+    base = fingerprint([first])
+    assert fingerprint([first]) == base
+    assert fingerprint([first, second]) != base
+
+    first.write_text('{"shiptracks": []}')
+    assert fingerprint([first]) != base
+
+
+def test_is_done_needs_same_inputs_and_report(tmp_path):
+    race = tmp_path / "B-Match1.json"
+    race.write_text("{}")
+    job = make_job(tmp_path, [race])
+    state = {job['key']: {'status': 'ok', 'inputs': job['inputs']}}
+
+    assert not is_done(job, state)  # rapport ontbreekt
+    (tmp_path / "rapport.md").write_text("# rapport")
+    assert is_done(job, state)
+
+    stat = race.stat()
+    os.utime(race, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not is_done(make_job(tmp_path, [race]), state)
+    assert not is_done(job, {job['key']: {'status': 'failed'}})
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from ifks.compare import EARTH_RADIUS, compare_race, final_gain_matrix, head_to_head
+
+LAT0, LON0 = 52.9, 5.4
+STEP = 5
+
+
+def north(y):
+    """Breedtegraad `y` meter ten noorden van LAT0."""
+    return LAT0 + np.degrees(np.asarray(y, dtype=float) / EARTH_RADIUS)
+
+
+def ship(name, y, course, speed=60):
+    stamps = np.arange(len(y)) * STEP
+    return {'name': name, 'stamp': stamps.tolist(), 'lat': north(y).tolist(),
+            'lon': [LON0] * len(y), 'speed': [speed] * len(y), 'course': list(course)}
+
+
+def race(ships, end, buoys=()):
+    # Wind uit het noorden: aan de wind is naar het noorden, voor de wind naar het zuiden
+    return {'starttime': 0, 'endtime': end, 'shiptracks': ships, 'buoytracks': list(buoys),
+            'windtracks': [{'name': 'station', 'stamp': [0, end], 'course': [0, 0], 'speed': [5, 5]}]}
+
+
+def up_and_down(rate, n):
+    """Eerst `n` stappen naar het noorden, dan `n` stappen terug, met `rate` m/s."""
+    up = np.arange(n + 1) * rate * STEP
+    down = up[-1] - np.arange(1, n + 1) * rate * STEP
+    return np.concatenate([up, down]), [0] * (n + 1) + [180] * n
+
+
+def test_faster_boat_gains_upwind_and_downwind():
+    y_a, course_a = up_and_down(3, 120)
+    y_b, course_b = up_and_down(2, 120)
+    data = race([ship('A', y_a, course_a), ship('B', y_b, course_b)], end=240 * STEP)
+    result = compare_race(data, step=STEP)
+
+    # 1 m/s sneller over 2 x 600 s; voor de wind telt de winst ook positief
+    gain = head_to_head(result, 'A')[0]['gain']
+    assert gain == pytest.approx(1200, rel=0.05)
+    matrix = final_gain_matrix(result)
+    assert matrix[0, 1] == pytest.approx(-matrix[1, 0])
+
+
+def test_gain_counts_from_the_start_line():
+    # Startlijn van west naar oost op y = 0; beide schepen beginnen 290 m eronder
+    line = {'stamp': [0, 1000], 'lat': [LAT0, LAT0]}
+    buoys = [dict(line, name='Start', lineto='Pin', lon=[LON0 - 0.01] * 2),
+             dict(line, name='Pin', lineto='', lon=[LON0 + 0.01] * 2)]
+    n = 120
+    y_a = -290 + np.arange(n + 1) * 3 * STEP
+    y_b = -290 + np.arange(n + 1) * 2 * STEP
+    data = race([ship('A', y_a, [0] * (n + 1)), ship('B', y_b, [0] * (n + 1))], end=n * STEP, buoys=buoys)
+    result = compare_race(data, step=STEP)
+
+    # A passeert de lijn tussen 95 en 100 s; wat A daarvoor al won telt niet mee
+    assert result['start'] == 100
+    assert head_to_head(result, 'A')[0]['gain'] == pytest.approx(500, rel=0.05)
+
+
+def test_without_wind_data_is_an_error():
+    data = race([ship('A', [0, 10], [0, 0])], end=STEP)
+    data['windtracks'] = []
+    with pytest.raises(ValueError):
+        compare_race(data, step=STEP)
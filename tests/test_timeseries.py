@@ -0,0 +1,26 @@
+import numpy as np
+
+from ifks.timeseries import break_at_wrap, minmax_downsample
+
+
+def test_short_series_is_kept_whole():
+    x = np.arange(10)
+    assert minmax_downsample(x, x * 2.0, buckets=5).tolist() == list(range(10))
+
+
+def test_peaks_survive_downsampling():
+    x = np.arange(10000)
+    y = np.zeros(10000)
+    y[1234], y[8765] = 50, -50
+    idx = minmax_downsample(x, y, buckets=100)
+    assert len(idx) <= 4 * 100
+    assert {0, 9999, 1234, 8765} <= set(idx.tolist())
+    assert np.all(np.diff(idx) > 0)
+
+
+def test_course_line_breaks_at_north():
+    times = np.arange(4)
+    t, course = break_at_wrap(times, np.array([350.0, 355, 365, 370]))
+    assert np.isnan(course).sum() == 1
+    assert np.allclose(course[~np.isnan(course)], [350, 355, 5, 10])
+    assert len(t) == len(course)
@@ -0,0 +1,58 @@
+import numpy as np
+
+from ifks.wind import (BACK, GUST, HEADED, LIFTED, LULL, SHIFT_SIGMA, VEER, count_runs, detect_gusts,
+                       detect_shifts, label_fixes)
+
+
+def test_veer_and_back_between_samples():
+    # Drie stations die allemaal eerst 10° ruimen en dan 10° krimpen
+    direction = np.array([[200, 210, 200],
+                          [202, 212, 202],
+                          [198, 208, 198]], dtype=float)
+    delta, label, _ = detect_shifts(direction)
+    assert np.allclose(delta, [10, -10])
+    assert label.tolist() == [VEER, BACK]
+
+
+def test_veer_across_north():
+    direction = np.array([[355, 5], [356, 6], [354, 4]], dtype=float)
+    delta, label, _ = detect_shifts(direction)
+    assert np.allclose(delta, [10])
+    assert label.tolist() == [VEER]
+
+
+def test_noise_between_stations_is_no_shift():
+    # Het gemiddelde draait 6°, maar de stations zijn het oneens: ruis, geen shift
+    direction = np.array([[200, 230], [200, 180], [200, 208]], dtype=float)
+    delta, label, stderr = detect_shifts(direction)
+    assert abs(delta[0]) >= 5
+    assert abs(delta[0]) < SHIFT_SIGMA * stderr[0]
+    assert label.tolist() == [0]
+
+
+def test_lifted_and_headed_on_both_tacks():
+    # Wind van 0° die 10° ruimt naar 10°
+    course = np.array([45, 315])  # bakboord- en stuurboordboeg aan de wind
+    label = label_fixes(course, wind_now=10, wind_ref=0)
+    # Over bakboord (koers 45) komt de wind voorlijker in, over stuurboord (koers 315) achterlijker
+    assert label.tolist() == [HEADED, LIFTED]
+    # Krimpt de wind juist, dan is het andersom
+    assert label_fixes(course, wind_now=-10, wind_ref=0).tolist() == [LIFTED, HEADED]
+
+
+def test_no_label_without_reference_wind():
+    assert label_fixes(np.array([45, 315]), wind_now=10, wind_ref=np.nan).tolist() == [0, 0]
+
+
+def test_runs_are_counted_per_station():
+    label = np.array([[GUST, GUST, 0, GUST],
+                      [0, GUST, GUST, 0],
+                      [LULL, LULL, LULL, LULL]])
+    assert count_runs(label, GUST) == 3
+    assert count_runs(label, LULL) == 1
+
+
+def test_gusts_relative_to_station_mean():
+    speed = np.array([[10, 10, 13, 7], [5, 5, 5, 5]], dtype=float)
+    _, label = detect_gusts(speed)
+    assert label.tolist() == [[0, 0, GUST, LULL], [0, 0, 0, 0]]